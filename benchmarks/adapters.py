@@ -0,0 +1,304 @@
+"""어댑터 진입점별 부하 테스트 (LLM / 외부 서비스 없이 스텁 에이전트 사용).
+
+from_graph, from_function, from_class, @a2a_agent 각각에 대해 message/send와
+message/stream을 동시성 단계별로 호출하고 처리량, p50/p99 지연 시간,
+첫 청크까지의 시간(TTFC), 요청당 메모리를 JSON으로 저장합니다.
+
+    python benchmarks/adapters.py --requests 500 --concurrency 1,8,32 --output bench.json
+    python benchmarks/adapters.py --baseline bench.json        # 기준 대비 회귀 확인 (회귀 시 exit 1)
+    python benchmarks/adapters.py --server localhost           # 실제 uvicorn 서버로 측정
+
+inproc 모드의 `httpx.ASGITransport`는 응답 본문을 모두 받은 뒤 반환하므로 TTFC는
+`--server localhost`에서만 측정합니다 (inproc 결과에서는 null).
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import socket
+import sys
+import threading
+import time
+import tracemalloc
+import uuid
+from typing import Annotated, Any, Dict, List, Optional, TypedDict
+
+import httpx
+import uvicorn
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage
+from langgraph.graph import END, START, StateGraph
+from langgraph.graph.message import add_messages
+
+from langgraph_a2a_adapters import AgentConfig, LangGraphA2AAdapter, a2a_agent
+
+REPLY = "stub agent reply with a handful of tokens to stream back to the client"
+WORK_SECONDS = 0.0
+
+
+class State(TypedDict):
+    messages: Annotated[list, add_messages]
+
+
+async def respond(state: State) -> dict:
+    if WORK_SECONDS:
+        await asyncio.sleep(WORK_SECONDS)
+    llm = GenericFakeChatModel(messages=iter([AIMessage(content=REPLY)]))
+    return {"messages": [await llm.ainvoke(state["messages"])]}
+
+
+def build_graph():
+    builder = StateGraph(State)
+    builder.add_node("respond", respond)
+    builder.add_edge(START, "respond")
+    builder.add_edge("respond", END)
+    return builder.compile()
+
+
+def stub_function(query: str) -> str:
+    if WORK_SECONDS:
+        time.sleep(WORK_SECONDS)
+    return REPLY
+
+
+class StubAgent:
+    def invoke(self, query: str) -> str:
+        if WORK_SECONDS:
+            time.sleep(WORK_SECONDS)
+        return REPLY
+
+
+@a2a_agent(name="bench-decorated")
+def stub_generator(query: str):
+    if WORK_SECONDS:
+        time.sleep(WORK_SECONDS)
+    for word in REPLY.split():
+        yield word + " "
+
+
+def build_adapters() -> Dict[str, LangGraphA2AAdapter]:
+    return {
+        "from_graph": LangGraphA2AAdapter.from_graph(build_graph(), AgentConfig(name="bench-graph")),
+        "from_function": LangGraphA2AAdapter.from_function(stub_function, AgentConfig(name="bench-function")),
+        "from_class": LangGraphA2AAdapter.from_class(StubAgent(), AgentConfig(name="bench-class")),
+        "a2a_agent": stub_generator.adapter,
+    }
+
+
+def request_body(method: str) -> dict:
+    return {
+        "jsonrpc": "2.0",
+        "id": str(uuid.uuid4()),
+        "method": method,
+        "params": {
+            "message": {
+                "role": "user",
+                "messageId": str(uuid.uuid4()),
+                "parts": [{"kind": "text", "text": "benchmark query"}],
+            }
+        },
+    }
+
+
+async def send_once(client: httpx.AsyncClient) -> Dict[str, Any]:
+    start = time.perf_counter()
+    response = await client.post("/", json=request_body("message/send"))
+    result = response.json().get("result") or {}
+    ok = (result.get("status") or {}).get("state") == "completed"
+    return {"latency": time.perf_counter() - start, "ttfc": None, "ok": ok}
+
+
+async def stream_once(client: httpx.AsyncClient) -> Dict[str, Any]:
+    start = time.perf_counter()
+    ttfc = None
+    ok = False
+    async with client.stream("POST", "/", json=request_body("message/stream")) as response:
+        async for line in response.aiter_lines():
+            if not line.startswith("data:"):
+                continue
+            result = json.loads(line[5:]).get("result") or {}
+            # 첫 청크: 응답 내용을 담은 첫 이벤트 (working 상태 알림 제외)
+            has_content = result.get("kind") == "artifact-update" or (result.get("status") or {}).get("message")
+            if ttfc is None and has_content:
+                ttfc = time.perf_counter() - start
+            if (result.get("status") or {}).get("state") == "completed":
+                ok = True
+    return {"latency": time.perf_counter() - start, "ttfc": ttfc, "ok": ok}
+
+
+async def run_level(client: httpx.AsyncClient, method: str, concurrency: int, requests: int) -> List[Dict[str, Any]]:
+    call = stream_once if method == "message/stream" else send_once
+    remaining = iter(range(requests))
+    samples: List[Dict[str, Any]] = []
+
+    async def worker() -> None:
+        for _ in remaining:
+            samples.append(await call(client))
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return samples
+
+
+def percentile(values: List[float], p: float) -> Optional[float]:
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(p * (len(ordered) - 1) + 0.5))]
+
+
+def ms(value: Optional[float]) -> Optional[float]:
+    return None if value is None else round(value * 1000, 3)
+
+
+async def measure(client: httpx.AsyncClient, entry: str, method: str, concurrency: int, args) -> Dict[str, Any]:
+    await run_level(client, method, concurrency, min(args.warmup, args.requests))
+
+    start = time.perf_counter()
+    samples = await run_level(client, method, concurrency, args.requests)
+    elapsed = time.perf_counter() - start
+
+    # 메모리는 tracemalloc 오버헤드가 처리량에 섞이지 않도록 별도로 측정
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    await run_level(client, method, concurrency, args.memory_requests)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    latencies = [sample["latency"] for sample in samples]
+    # inproc는 스트림이 버퍼링되어 첫 청크 시각이 전체 응답 시각과 같으므로 기록하지 않음
+    ttfcs = [] if args.server == "inproc" else [sample["ttfc"] for sample in samples if sample["ttfc"] is not None]
+    return {
+        "entry": entry,
+        "method": method,
+        "concurrency": concurrency,
+        "requests": len(samples),
+        "errors": sum(not sample["ok"] for sample in samples),
+        "throughput_rps": round(len(samples) / elapsed, 1),
+        "p50_ms": ms(percentile(latencies, 0.5)),
+        "p99_ms": ms(percentile(latencies, 0.99)),
+        "ttfc_p50_ms": ms(percentile(ttfcs, 0.5)),
+        "ttfc_p99_ms": ms(percentile(ttfcs, 0.99)),
+        # 요청 후 남은 메모리(Task 저장소 등)와 동시 실행 요청당 최대 사용량
+        "retained_kb_per_request": round((current - before) / 1024 / args.memory_requests, 2),
+        "peak_kb_per_inflight": round((peak - before) / 1024 / concurrency, 2),
+    }
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def open_client(adapter: LangGraphA2AAdapter, mode: str):
+    """(client, 정리 함수) 반환. inproc는 ASGI 직접 호출, localhost는 uvicorn 서버."""
+    limits = httpx.Limits(max_connections=1000, max_keepalive_connections=1000)
+    if mode == "inproc":
+        client = httpx.AsyncClient(transport=httpx.ASGITransport(app=adapter.app), base_url="http://bench", limits=limits)
+        return client, None
+
+    port = free_port()
+    server = uvicorn.Server(uvicorn.Config(adapter.app, host="127.0.0.1", port=port, log_level="warning"))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        await asyncio.sleep(0.05)
+
+    def stop() -> None:
+        server.should_exit = True
+        thread.join()
+
+    client = httpx.AsyncClient(base_url=f"http://127.0.0.1:{port}", limits=limits, timeout=60.0)
+    return client, stop
+
+
+def compare(results: List[Dict[str, Any]], baseline_path: str, tolerance: float) -> List[str]:
+    """기준 대비 처리량 감소 또는 p99 증가가 tolerance(비율)를 넘은 항목."""
+    with open(baseline_path) as f:
+        baseline = {
+            (r["entry"], r["method"], r["concurrency"]): r for r in json.load(f)["results"]
+        }
+
+    regressions = []
+    for result in results:
+        base = baseline.get((result["entry"], result["method"], result["concurrency"]))
+        if base is None:
+            continue
+        name = f"{result['entry']} {result['method']} c={result['concurrency']}"
+        if result["throughput_rps"] < base["throughput_rps"] * (1 - tolerance):
+            regressions.append(f"{name}: throughput {base['throughput_rps']} -> {result['throughput_rps']} rps")
+        if base["p99_ms"] and result["p99_ms"] > base["p99_ms"] * (1 + tolerance):
+            regressions.append(f"{name}: p99 {base['p99_ms']} -> {result['p99_ms']} ms")
+    return regressions
+
+
+async def main(args) -> int:
+    global WORK_SECONDS
+    WORK_SECONDS = args.work_ms / 1000
+
+    adapters = build_adapters()
+    entries = args.entries.split(",") if args.entries else list(adapters)
+    methods = ["message/send", "message/stream"] if args.method == "both" else [args.method]
+    levels = [int(level) for level in args.concurrency.split(",")]
+
+    if args.server == "inproc" and "message/stream" in methods:
+        print("ttfc: n/a in-process (ASGITransport buffers the whole response body); use --server localhost")
+
+    results = []
+    for entry in entries:
+        client, stop = await open_client(adapters[entry], args.server)
+        async with client:
+            for method in methods:
+                for concurrency in levels:
+                    result = await measure(client, entry, method, concurrency, args)
+                    results.append(result)
+                    ttfc = ""
+                    if method == "message/stream":
+                        ttfc = "  ttfc n/a" if result["ttfc_p50_ms"] is None else f"  ttfc p50 {result['ttfc_p50_ms']}ms"
+                    print(
+                        f"{entry:<14} {method:<15} c={concurrency:<4} {result['throughput_rps']:>9} rps"
+                        f"  p50 {result['p50_ms']}ms  p99 {result['p99_ms']}ms{ttfc}"
+                        f"  {result['retained_kb_per_request']}KB/req  errors {result['errors']}"
+                    )
+        if stop is not None:
+            stop()
+
+    report = {
+        "meta": {
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "server": args.server,
+            "ttfc_measured": args.server != "inproc",
+            "requests": args.requests,
+            "work_ms": args.work_ms,
+        },
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+    if args.baseline:
+        regressions = compare(results, args.baseline, args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--warmup", type=int, default=50)
+    parser.add_argument("--memory-requests", type=int, default=100)
+    parser.add_argument("--concurrency", default="1,8,32")
+    parser.add_argument("--entries", default="", help="from_graph,from_function,from_class,a2a_agent")
+    parser.add_argument("--method", choices=["message/send", "message/stream", "both"], default="both")
+    parser.add_argument("--server", choices=["inproc", "localhost"], default="inproc")
+    parser.add_argument("--work-ms", type=float, default=0.0, help="스텁 에이전트의 가짜 작업 시간")
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    parser.add_argument("--baseline", help="비교할 기준 결과 JSON")
+    parser.add_argument("--tolerance", type=float, default=0.10, help="허용 회귀 비율")
+    sys.exit(asyncio.run(main(parser.parse_args())))
@@ -0,0 +1,104 @@
+"""패키지 import 시간 측정 (콜드 스타트 / CLI 도구용).
+
+import 구문마다 새 인터프리터를 띄워 시간을 재고, 서버 전용 모듈(uvicorn, FastAPI 등)이
+필요 없는 import에서 불러와졌는지 확인합니다. 불러와졌거나 기준 결과보다 느려지면
+exit 1로 종료합니다.
+
+    python benchmarks/import_time.py --repeat 10 --output import.json
+    python benchmarks/import_time.py --baseline import.json
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from typing import Any, Dict, List
+
+SERVER_MODULES = ["uvicorn", "fastapi", "a2a.server.apps"]
+GRAPH_MODULES = ["langgraph.graph.state"]
+A2A_MODULES = ["a2a.types", "a2a.server.tasks"]
+
+# (import 구문, 불러오면 안 되는 모듈)
+CASES = [
+    ("import langgraph_a2a_adapters", SERVER_MODULES + GRAPH_MODULES + A2A_MODULES),
+    ("from langgraph_a2a_adapters import AgentConfig", SERVER_MODULES + GRAPH_MODULES + A2A_MODULES),
+    ("from langgraph_a2a_adapters import a2a_agent", SERVER_MODULES + GRAPH_MODULES + A2A_MODULES),
+    ("from langgraph_a2a_adapters import LangGraphExecutor", SERVER_MODULES + GRAPH_MODULES + A2A_MODULES),
+    ("from langgraph_a2a_adapters import LangGraphA2AAdapter", SERVER_MODULES + GRAPH_MODULES),
+    ("from langgraph_a2a_adapters import A2AHost", []),
+]
+
+PROBE = """
+import json, sys, time
+started = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - started
+print(json.dumps({{"ms": elapsed * 1000, "loaded": [m for m in {modules!r} if m in sys.modules]}}))
+"""
+
+
+def measure(statement: str, forbidden: List[str], repeat: int) -> Dict[str, Any]:
+    samples = []
+    loaded: List[str] = []
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-c", PROBE.format(statement=statement, modules=forbidden)],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        samples.append(result["ms"])
+        loaded = result["loaded"]
+    return {
+        "statement": statement,
+        "median_ms": round(statistics.median(samples), 2),
+        "min_ms": round(min(samples), 2),
+        "unexpected_modules": loaded,
+    }
+
+
+def compare(results: List[Dict[str, Any]], baseline_path: str, tolerance: float) -> List[str]:
+    with open(baseline_path) as f:
+        baseline = {r["statement"]: r for r in json.load(f)["results"]}
+
+    regressions = []
+    for result in results:
+        base = baseline.get(result["statement"])
+        # 아주 짧은 import는 측정 잡음이 커서 절대 차이 5ms 미만은 무시
+        if base and result["median_ms"] > max(base["median_ms"] * (1 + tolerance), base["median_ms"] + 5):
+            regressions.append(f"{result['statement']}: {base['median_ms']} -> {result['median_ms']} ms")
+    return regressions
+
+
+def main(args) -> int:
+    results = [measure(statement, forbidden, args.repeat) for statement, forbidden in CASES]
+
+    print(f"{'import':<58} {'median':>10} {'min':>10}")
+    for result in results:
+        print(f"{result['statement']:<58} {result['median_ms']:>8.1f}ms {result['min_ms']:>8.1f}ms")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"meta": {"python": sys.version.split()[0], "repeat": args.repeat}, "results": results}, f, indent=2)
+
+    failures = [
+        f"{result['statement']}: loaded {', '.join(result['unexpected_modules'])}"
+        for result in results
+        if result["unexpected_modules"]
+    ]
+    if args.baseline:
+        failures += [f"REGRESSION {regression}" for regression in compare(results, args.baseline, args.tolerance)]
+    for failure in failures:
+        print(failure)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    parser.add_argument("--baseline", help="비교할 기준 결과 JSON")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="허용 회귀 비율")
+    sys.exit(main(parser.parse_args()))
@@ -0,0 +1,76 @@
+"""Task 저장소 쓰기/읽기 처리량 벤치마크.
+
+    python benchmarks/task_store.py --tasks 20000
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+import uuid
+
+from a2a.server.tasks import InMemoryTaskStore
+from a2a.types import Message, Part, Role, Task, TaskState, TaskStatus, TextPart
+
+from langgraph_a2a_adapters.task_store import BoundedTaskStore, SQLiteTaskStore
+
+
+def make_task(i: int, history: int) -> Task:
+    messages = [
+        Message(
+            role=Role.user if n % 2 == 0 else Role.agent,
+            messageId=str(uuid.uuid4()),
+            parts=[Part(root=TextPart(text=f"message {n} of task {i} " * 8))],
+        )
+        for n in range(history)
+    ]
+    return Task(
+        id=f"task-{i}",
+        contextId=f"context-{i % 100}",
+        status=TaskStatus(state=TaskState.completed),
+        history=messages,
+    )
+
+
+async def run(name: str, store, tasks) -> dict:
+    start = time.perf_counter()
+    for task in tasks:
+        await store.save(task)
+    if hasattr(store, "flush"):
+        await store.flush()
+    write_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for task in tasks:
+        await store.get(task.id)
+    read_seconds = time.perf_counter() - start
+
+    return {
+        "store": name,
+        "writes_per_sec": round(len(tasks) / write_seconds),
+        "reads_per_sec": round(len(tasks) / read_seconds),
+    }
+
+
+async def main(count: int, history: int) -> None:
+    tasks = [make_task(i, history) for i in range(count)]
+    with tempfile.TemporaryDirectory() as tmp:
+        sqlite_store = SQLiteTaskStore(os.path.join(tmp, "tasks.db"))
+        results = [
+            await run("InMemoryTaskStore", InMemoryTaskStore(), tasks),
+            await run("BoundedTaskStore", BoundedTaskStore(max_entries=None, max_bytes=None, ttl=None, active_ttl=None), tasks),
+            await run("SQLiteTaskStore", sqlite_store, tasks),
+        ]
+        await sqlite_store.close()
+
+    for result in results:
+        print(f"{result['store']:<20} write {result['writes_per_sec']:>9}/s  read {result['reads_per_sec']:>9}/s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tasks", type=int, default=10_000)
+    parser.add_argument("--history", type=int, default=4)
+    args = parser.parse_args()
+    asyncio.run(main(args.tasks, args.history))
@@ -2,10 +2,14 @@
 
 from typing import Any, Optional, TypedDict
 
+import httpx
 from langchain_openai import ChatOpenAI
 from langchain_core.messages import HumanMessage, AIMessage, BaseMessage
+from langchain_core.runnables import RunnableConfig
 from langgraph.graph import StateGraph, START, END
 
+from langgraph_a2a_adapters import credential_key, get_resource_cache
+
 
 class SimpleState(TypedDict):
     query: str
@@ -44,7 +48,25 @@ def _get_langfuse_callback(api_config: dict):
         return None
 
 
-def chat_node(state: SimpleState) -> dict:
+def _create_llm(model: str, api_key: str, base_url: Optional[str]) -> ChatOpenAI:
+    # 캐시 항목마다 전용 httpx 클라이언트 사용 (기본 클라이언트는 모든 ChatOpenAI가 공유하므로 닫으면 안 됨)
+    return ChatOpenAI(
+        model=model,
+        api_key=api_key,
+        base_url=base_url,
+        temperature=0.7,
+        http_client=httpx.Client(),
+        http_async_client=httpx.AsyncClient(),
+    )
+
+
+async def _close_llm(llm: ChatOpenAI) -> None:
+    """캐시에서 제거될 때 httpx 커넥션 풀 종료 (ChatOpenAI에는 close가 없음)."""
+    llm.http_client.close()
+    await llm.http_async_client.aclose()
+
+
+def chat_node(state: SimpleState, config: RunnableConfig) -> dict:
     """LLM 호출."""
     api_config = state.get('api_config') or {}
     print(f"[DEBUG] api_config keys: {list(api_config.keys())}")
@@ -55,11 +77,12 @@ def chat_node(state: SimpleState) -> dict:
         return {"messages": [AIMessage(content="❌ X-OPENAI-API-KEY 헤더가 필요합니다.")]}
 
     model = api_config.get('OPENAI_MODEL') or "gpt-4.1"
-    llm = ChatOpenAI(
-        model=model,
-        api_key=api_key,
-        base_url=api_config.get('OPENAI_BASE_URL'),
-        temperature=0.7,
+    base_url = api_config.get('OPENAI_BASE_URL')
+    # 같은 키/URL/모델이면 클라이언트(커넥션 풀)를 요청 간 재사용
+    llm = get_resource_cache(config).get_or_create(
+        credential_key(api_key, base_url, model),
+        lambda: _create_llm(model, api_key, base_url),
+        close=_close_llm,
     )
 
     prompt = f"""사용자 메시지에 답변하세요.
@@ -35,6 +35,8 @@ def main():
         input_key="query",
         output_key="messages",
         use_langchain_messages=False,
+        # 검색 결과 / 중간 분석은 응답에 남기지 않음
+        output_keys=["summary"],
     )
     adapter.serve()
 
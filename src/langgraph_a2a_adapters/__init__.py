@@ -1,9 +1,41 @@
 """LangGraph A2A Adapters."""
 
-from langgraph_a2a_adapters.adapter import LangGraphA2AAdapter
-from langgraph_a2a_adapters.config import AgentConfig, AgentSkill
-from langgraph_a2a_adapters.executor import LangGraphExecutor
-from langgraph_a2a_adapters.decorators import a2a_agent
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from langgraph_a2a_adapters.adapter import LangGraphA2AAdapter
+    from langgraph_a2a_adapters.cache import ResourceCache, credential_key, get_resource_cache
+    from langgraph_a2a_adapters.cancellation import is_cancelled
+    from langgraph_a2a_adapters.config import AgentConfig, AgentSkill
+    from langgraph_a2a_adapters.executor import LangGraphExecutor
+    from langgraph_a2a_adapters.decorators import a2a_agent
+    from langgraph_a2a_adapters.host import A2AHost
+    from langgraph_a2a_adapters.parts import InputFile, RequestInput, current_input
+    from langgraph_a2a_adapters.remote import RemoteA2AExecutor, remote_agent_tool
+    from langgraph_a2a_adapters.router import RouterExecutor
+    from langgraph_a2a_adapters.tracing import configure_tracing
+
+# 이름 -> 모듈. 처음 접근할 때 import (AgentConfig만 쓰는 코드가 서버 스택을 불러오지 않음)
+_EXPORTS = {
+    "LangGraphA2AAdapter": "adapter",
+    "AgentConfig": "config",
+    "AgentSkill": "config",
+    "LangGraphExecutor": "executor",
+    "a2a_agent": "decorators",
+    "is_cancelled": "cancellation",
+    "ResourceCache": "cache",
+    "credential_key": "cache",
+    "get_resource_cache": "cache",
+    "A2AHost": "host",
+    "current_input": "parts",
+    "RequestInput": "parts",
+    "InputFile": "parts",
+    "RemoteA2AExecutor": "remote",
+    "remote_agent_tool": "remote",
+    "RouterExecutor": "router",
+    "configure_tracing": "tracing",
+}
 
 __version__ = "0.0.2"
 __all__ = [
@@ -12,4 +44,29 @@ __all__ = [
     "AgentSkill",
     "LangGraphExecutor",
     "a2a_agent",
+    "is_cancelled",
+    "ResourceCache",
+    "credential_key",
+    "get_resource_cache",
+    "A2AHost",
+    "current_input",
+    "RequestInput",
+    "InputFile",
+    "RemoteA2AExecutor",
+    "remote_agent_tool",
+    "RouterExecutor",
+    "configure_tracing",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f"{__name__}.{module}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted([*globals(), *_EXPORTS])
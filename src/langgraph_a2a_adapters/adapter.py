@@ -1,18 +1,24 @@
 """LangGraph A2A Adapter."""
 
-from typing import Any, Callable, Optional, Union
+from __future__ import annotations
 
-import uvicorn
-from langgraph.graph.state import CompiledStateGraph
+import asyncio
+import inspect
+import uuid
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, Any, Callable, List, Optional, Tuple, Union
 
 from a2a.server.agent_execution import AgentExecutor, RequestContext
 from a2a.server.events import EventQueue
-from a2a.server.apps import A2AFastAPIApplication
 from a2a.server.request_handlers import DefaultRequestHandler
-from a2a.server.tasks import InMemoryTaskStore
-from a2a.types import Task, TaskState, TaskStatus, TaskStatusUpdateEvent, TextPart
+from a2a.server.tasks import TaskStore, TaskUpdater
+from a2a.types import Part, Task, TaskState, TaskStatus, TaskStatusUpdateEvent, TextPart
 from a2a.utils import new_agent_text_message
 
+from langgraph_a2a_adapters import tracing
+from langgraph_a2a_adapters.cache import ResourceCache
+from langgraph_a2a_adapters.cancellation import RunRegistry
+from langgraph_a2a_adapters.coalescing import SingleFlight
 from langgraph_a2a_adapters.config import AgentConfig
 from langgraph_a2a_adapters.executor import (
     BaseExecutor,
@@ -20,59 +26,288 @@ from langgraph_a2a_adapters.executor import (
     FunctionExecutor,
     ClassExecutor,
 )
+from langgraph_a2a_adapters.metrics import (
+    InstrumentedTaskStore,
+    Metrics,
+    TimedEventQueue,
+    optional_time,
+)
+from langgraph_a2a_adapters.parts import RequestInput, bind_input, extract_input, has_file_parts
+from langgraph_a2a_adapters.pool import (
+    ProcessWorkerPool,
+    WorkerPool,
+    WorkerPoolFullError,
+    ensure_picklable,
+)
+from langgraph_a2a_adapters.response_cache import (
+    DiskCacheBackend,
+    MemoryCacheBackend,
+    ResponseCache,
+    request_key,
+)
+from langgraph_a2a_adapters.task_store import BoundedTaskStore, SQLiteTaskStore
+
+if TYPE_CHECKING:
+    # 서버 전용 모듈(FastAPI, uvicorn)은 app / serve를 쓸 때 import
+    from a2a.server.apps import A2AFastAPIApplication
+    from fastapi import Response
+    from langgraph.graph.state import CompiledStateGraph
+
+    from langgraph_a2a_adapters.agent_card import AgentCardEndpoint
 
 
 class LangGraphAgentExecutor(AgentExecutor):
     """LangGraph 실행기를 A2A AgentExecutor로 래핑."""
 
-    def __init__(self, executor: BaseExecutor):
+    def __init__(
+        self,
+        executor: BaseExecutor,
+        response_cache: Optional[ResponseCache] = None,
+        coalesce_requests: bool = False,
+        metrics: Optional[Metrics] = None,
+        input_spool_threshold: int = 1024 * 1024,
+        artifact_chunk_size: int = 64 * 1024,
+    ):
         self.executor = executor
+        self.response_cache = response_cache
+        self.coalescer = SingleFlight() if coalesce_requests else None
+        self.metrics = metrics
+        self.input_spool_threshold = input_spool_threshold
+        self.artifact_chunk_size = artifact_chunk_size
+        self.runs = RunRegistry()
 
     async def execute(self, context: RequestContext, event_queue: EventQueue) -> None:
+        metrics = self.metrics
+        if metrics is None and not tracing.enabled():
+            # tasks/cancel 시 이 실행을 실제로 중단할 수 있도록 등록
+            with self.runs.track(context.task_id):
+                await self._execute(context, event_queue)
+            return
+
+        method = "message/stream" if self._is_streaming_request(context) else "message/send"
+        outcome = "canceled"
+        if metrics is not None:
+            metrics.add_gauge("a2a_requests_in_flight", 1)
+            event_queue = TimedEventQueue(event_queue, metrics)
+        # 상위 에이전트가 보낸 traceparent 헤더를 부모로 사용
+        attributes = {"a2a.method": method, "a2a.task_id": context.task_id, "a2a.context_id": context.context_id}
+        with tracing.span(method, "server", self._headers(context), attributes) as span:
+            try:
+                with self.runs.track(context.task_id), optional_time(metrics, "a2a_stage_seconds", stage="total"):
+                    outcome = await self._execute(context, event_queue)
+            finally:
+                tracing.set_outcome(span, outcome)
+                if metrics is not None:
+                    metrics.add_gauge("a2a_requests_in_flight", -1)
+                    metrics.inc("a2a_requests_total", method=method, outcome=outcome)
+
+    async def _execute(self, context: RequestContext, event_queue: EventQueue) -> str:
+        """요청 실행 후 결과 상태(completed, rejected, failed) 반환."""
         task_id = context.task_id
         context_id = context.context_id
 
-        input_text = self._extract_input_text(context)
-        api_config = self._extract_api_config(context)
-
         try:
-            await event_queue.enqueue_event(
-                TaskStatusUpdateEvent(
-                    taskId=task_id,
+            with optional_time(self.metrics, "a2a_stage_seconds", stage="extract_input"):
+                request_input = await self._extract_input(context)
+        except Exception as e:
+            # 잘못된 파일 파트(base64) 등
+            await event_queue.enqueue_event(self._failed_task(task_id, context_id, e))
+            return "failed"
+        input_text = request_input.text
+        # 파일 / 데이터 파트가 있으면 입력 텍스트만으로 같은 요청인지 알 수 없음
+        attachments = bool(request_input.files or request_input.data)
+        with optional_time(self.metrics, "a2a_stage_seconds", stage="api_config"):
+            api_config = self._extract_api_config(context)
+
+        with bind_input(request_input):
+            try:
+                await event_queue.enqueue_event(
+                    TaskStatusUpdateEvent(
+                        taskId=task_id,
+                        contextId=context_id,
+                        status=TaskStatus(state=TaskState.working),
+                        final=False,
+                    )
+                )
+
+                streaming = self._is_streaming_request(context)
+                cache_key, cache_mode = (None, "use") if attachments else self._cache_lookup_key(context, input_text, api_config)
+                result = None
+                if cache_key is not None and cache_mode == "use":
+                    result = await self.response_cache.get(cache_key)
+
+                if result is None:
+                    store_key = cache_key if cache_mode != "no-store" else None
+
+                    async def run() -> dict:
+                        if streaming:
+                            return await self._stream(context, event_queue, input_text, api_config, store_key)
+                        return await self._invoke(input_text, context_id, api_config, store_key)
+
+                    shared = False
+                    with optional_time(self.metrics, "a2a_stage_seconds", stage="execute"), tracing.span("execute"):
+                        if self.coalescer is None or attachments:
+                            result = await run()
+                        else:
+                            result, shared = await self.coalescer.run(
+                                self._coalesce_key(context, input_text, api_config), run
+                            )
+                    # 직접 스트리밍한 요청은 이미 완료 이벤트를 보냄
+                    if streaming and not shared:
+                        return "completed"
+
+                if streaming:
+                    # 캐시 적중 또는 다른 요청의 결과 공유: 최종 응답만 전달
+                    updater = TaskUpdater(event_queue, task_id, context_id)
+                    await self._complete_stream(updater, result.get("content", ""), streamed=False)
+                    return "completed"
+
+                response_text = result.get("content", "")
+                response_message = new_agent_text_message(response_text)
+
+                history = (
+                    [context.message, response_message]
+                    if context.message
+                    else [response_message]
+                )
+                task = Task(
+                    id=task_id,
                     contextId=context_id,
-                    status=TaskStatus(state=TaskState.working),
-                    final=False,
+                    status=TaskStatus(state=TaskState.completed),
+                    history=history,
                 )
-            )
+                await event_queue.enqueue_event(task)
+                return "completed"
+
+            except WorkerPoolFullError as e:
+                # 과부하: 빠르게 거절하고 클라이언트가 재시도하도록 표시
+                rejected_task = Task(
+                    id=task_id,
+                    contextId=context_id,
+                    status=TaskStatus(state=TaskState.rejected),
+                    history=[new_agent_text_message(f"Busy: {str(e)}")],
+                    metadata={"retryable": True},
+                )
+                await event_queue.enqueue_event(rejected_task)
+                return "rejected"
 
-            result = await self.executor.ainvoke(input_text, api_config=api_config)
-            response_text = result.get("content", "")
-            response_message = new_agent_text_message(response_text)
+            except Exception as e:
+                await event_queue.enqueue_event(self._failed_task(task_id, context_id, e))
+                return "failed"
 
-            history = (
-                [context.message, response_message]
-                if context.message
-                else [response_message]
-            )
-            task = Task(
-                id=task_id,
-                contextId=context_id,
-                status=TaskStatus(state=TaskState.completed),
-                history=history,
-            )
-            await event_queue.enqueue_event(task)
+    @staticmethod
+    def _failed_task(task_id: str, context_id: str, error: Exception) -> Task:
+        return Task(
+            id=task_id,
+            contextId=context_id,
+            status=TaskStatus(state=TaskState.failed),
+            history=[new_agent_text_message(f"Error: {str(error)}")],
+        )
 
-        except Exception as e:
-            error_message = new_agent_text_message(f"Error: {str(e)}")
-            error_task = Task(
-                id=task_id,
-                contextId=context_id,
-                status=TaskStatus(state=TaskState.failed),
-                history=[error_message],
+    async def _invoke(
+        self,
+        input_text: str,
+        context_id: str,
+        api_config: dict,
+        cache_key: Optional[str] = None,
+    ) -> dict:
+        result = await self.executor.ainvoke(input_text, session_id=context_id, api_config=api_config)
+        # A2A 응답에는 content만 쓰므로 그래프 최종 상태 등은 바로 놓아줌
+        result = {key: value for key, value in result.items() if key != "data"}
+        if cache_key is not None:
+            await self.response_cache.set(cache_key, result)
+        return result
+
+    async def _stream(
+        self,
+        context: RequestContext,
+        event_queue: EventQueue,
+        input_text: str,
+        api_config: dict,
+        cache_key: Optional[str] = None,
+    ) -> dict:
+        """executor.astream 청크를 도착하는 대로 이벤트로 발행하고 최종 청크를 반환."""
+        updater = TaskUpdater(event_queue, context.task_id, context.context_id)
+        # 노드별로 하나의 artifact에 토큰을 이어 붙임
+        artifact_ids = {}
+
+        async for chunk in self.executor.astream(
+            input_text, session_id=context.context_id, api_config=api_config
+        ):
+            content = chunk.get("content", "")
+            node_name = chunk.get("node") or "response"
+
+            if chunk.get("is_task_complete"):
+                for artifact_id in artifact_ids.values():
+                    await updater.add_artifact(
+                        [Part(root=TextPart(text=""))],
+                        artifact_id=artifact_id,
+                        append=True,
+                        last_chunk=True,
+                    )
+                if cache_key is not None:
+                    await self.response_cache.set(cache_key, chunk)
+                await self._complete_stream(updater, content, streamed=bool(artifact_ids))
+                return chunk
+
+            if not content:
+                continue
+
+            if chunk.get("delta"):
+                append = node_name in artifact_ids
+                if not append:
+                    artifact_ids[node_name] = str(uuid.uuid4())
+                await self._add_artifact_chunks(updater, content, artifact_ids[node_name], node_name, append)
+            else:
+                await updater.update_status(
+                    TaskState.working,
+                    message=updater.new_agent_message(
+                        [Part(root=TextPart(text=content))],
+                        metadata={"node": node_name},
+                    ),
+                )
+
+        await updater.complete()
+        return {"content": "", "is_task_complete": True}
+
+    async def _add_artifact_chunks(
+        self,
+        updater: TaskUpdater,
+        text: str,
+        artifact_id: str,
+        name: str,
+        append: bool,
+        last_chunk: Optional[bool] = None,
+    ) -> None:
+        """긴 텍스트를 `artifact_chunk_size` 단위의 artifact 이벤트로 나눠 발행."""
+        size = self.artifact_chunk_size
+        for start in range(0, len(text), size):
+            end = start + size
+            await updater.add_artifact(
+                [Part(root=TextPart(text=text[start:end]))],
+                artifact_id=artifact_id,
+                name=name,
+                append=append,
+                last_chunk=last_chunk if end >= len(text) else None,
             )
-            await event_queue.enqueue_event(error_task)
+            append = True
+
+    async def _complete_stream(self, updater: TaskUpdater, content: str, streamed: bool) -> None:
+        """완료 이벤트 발행.
+
+        `artifact_chunk_size`보다 긴 응답은 최종 메시지에 다시 싣지 않고, artifact로 아직
+        보내지 않았으면(`streamed=False`) `append` / `lastChunk` 조각으로 나눠 보냅니다.
+        """
+        if len(content) <= self.artifact_chunk_size:
+            message = updater.new_agent_message([Part(root=TextPart(text=content))]) if content else None
+            await updater.complete(message=message)
+            return
+        if not streamed:
+            await self._add_artifact_chunks(updater, content, str(uuid.uuid4()), "response", False, last_chunk=True)
+        await updater.complete()
 
     async def cancel(self, context: RequestContext, event_queue: EventQueue) -> None:
+        self.runs.cancel(context.task_id)
         task = Task(
             id=context.task_id,
             contextId=context.context_id,
@@ -80,29 +315,73 @@ class LangGraphAgentExecutor(AgentExecutor):
         )
         await event_queue.enqueue_event(task)
 
-    def _extract_input_text(self, context: RequestContext) -> str:
-        if not context.message or not context.message.parts:
-            return ""
-
-        for part in context.message.parts:
-            if hasattr(part, "root"):
-                inner = part.root
-                if hasattr(inner, "text"):
-                    return inner.text
-            elif isinstance(part, TextPart):
-                return part.text
-            elif isinstance(part, dict) and part.get("kind") == "text":
-                return part.get("text", "")
-            elif hasattr(part, "text"):
-                return part.text
-        return ""
+    def _is_streaming_request(self, context: RequestContext) -> bool:
+        if not context.call_context or not context.call_context.state:
+            return False
+        return context.call_context.state.get('method') == 'message/stream'
 
-    def _extract_api_config(self, context: RequestContext) -> dict:
-        """X- prefix 헤더를 api_config로 추출 (환경변수 스타일)."""
+    def _headers(self, context: RequestContext) -> dict:
         if not context.call_context or not context.call_context.state:
             return {}
+        return context.call_context.state.get('headers', {})
+
+    def _cache_lookup_key(
+        self, context: RequestContext, input_text: str, api_config: dict
+    ) -> Tuple[Optional[str], str]:
+        """응답 캐시 키와 사용 방식("use", "no-cache", "no-store").
+
+        요청의 `Cache-Control: no-cache`는 조회만 건너뛰고 새 응답을 저장하며,
+        `no-store`는 조회와 저장을 모두 건너뜁니다.
+        """
+        if self.response_cache is None:
+            return None, "use"
+        if getattr(self.executor, "has_checkpointer", False):
+            # 체크포인터가 있으면 같은 입력도 대화 상태에 따라 응답이 다르고,
+            # 캐시 적중 시 그래프를 건너뛰어 이번 턴이 체크포인트에 기록되지 않음
+            return None, "use"
+
+        headers = self._headers(context)
+        cache_control = next(
+            (v.lower() for k, v in headers.items() if k.lower() == "cache-control"), ""
+        )
+        mode = "use"
+        if "no-store" in cache_control:
+            mode = "no-store"
+        elif "no-cache" in cache_control:
+            mode = "no-cache"
+        if mode != "use":
+            self.response_cache.record_bypass()
 
-        headers = context.call_context.state.get('headers', {})
+        skill_id = self._extract_skill_id(context)
+        return self.response_cache.make_key(input_text, skill_id, api_config), mode
+
+    def _coalesce_key(self, context: RequestContext, input_text: str, api_config: dict) -> str:
+        """병합 키: 입력 텍스트, 스킬 id, 모든 X- 헤더(테넌트)."""
+        session_id = ""
+        if getattr(self.executor, "has_checkpointer", False):
+            # 체크포인터가 있으면 대화 상태가 다르므로 같은 contextId끼리만 병합
+            session_id = context.context_id
+        return request_key(
+            input_text,
+            self._extract_skill_id(context),
+            sorted(api_config.items()),
+            session_id,
+        )
+
+    def _extract_skill_id(self, context: RequestContext) -> str:
+        metadata = (context.message.metadata if context.message else None) or {}
+        return metadata.get("skillId") or metadata.get("skill_id") or ""
+
+    async def _extract_input(self, context: RequestContext) -> RequestInput:
+        """텍스트 파트는 합치고 파일 / 데이터 파트는 `current_input()`으로 전달."""
+        if has_file_parts(context.message):
+            # 큰 파일은 디코딩하면서 디스크에 쓰므로 이벤트 루프 밖에서 처리
+            return await asyncio.to_thread(extract_input, context.message, self.input_spool_threshold)
+        return extract_input(context.message, self.input_spool_threshold)
+
+    def _extract_api_config(self, context: RequestContext) -> dict:
+        """X- prefix 헤더를 api_config로 추출 (환경변수 스타일)."""
+        headers = self._headers(context)
         # x- prefix 헤더만 추출, prefix 제거하고 대문자 + 언더스코어로 변환
         # X-OPENAI-API-KEY -> OPENAI_API_KEY
         return {
@@ -115,17 +394,113 @@ class LangGraphAgentExecutor(AgentExecutor):
 class LangGraphA2AAdapter:
     """LangGraph를 A2A 프로토콜로 노출하는 어댑터."""
 
-    def __init__(self, executor: BaseExecutor, config: AgentConfig):
+    def __init__(
+        self,
+        executor: BaseExecutor,
+        config: AgentConfig,
+        task_store: Optional[TaskStore] = None,
+    ):
         self.executor = executor
         self.config = config
         self._app = None
-        self._task_store = InMemoryTaskStore()
-        self._agent_executor = LangGraphAgentExecutor(executor)
+        self._a2a_app: Optional[A2AFastAPIApplication] = None
+        self._card_endpoint: Optional[AgentCardEndpoint] = None
+        self._startup_hooks: List[Callable[["LangGraphA2AAdapter"], Any]] = []
+        self.worker_pool = self._create_worker_pool(executor, config)
+        if executor.worker_pool is None:
+            executor.worker_pool = self.worker_pool
+        self.resources = ResourceCache(
+            max_size=config.resource_cache_size,
+            idle_ttl=config.resource_cache_ttl,
+        )
+        # use_shared로 받은 풀 / 캐시는 소유자(A2AHost)가 정리
+        self._owns_worker_pool = True
+        self._owns_resources = True
+        if executor.resources is None:
+            executor.resources = self.resources
+        self._task_store = task_store if task_store is not None else self._create_task_store(config)
+        self.response_cache = self._create_response_cache(config)
+        # 메트릭을 끄면 계측 코드가 호출되지 않음
+        self.metrics = Metrics() if config.metrics else None
+        if self.metrics is not None:
+            self._task_store = InstrumentedTaskStore(self._task_store, self.metrics)
+            if executor.metrics is None:
+                executor.metrics = self.metrics
+            if self.worker_pool.metrics is None:
+                self.worker_pool.metrics = self.metrics
+        # 트레이싱은 프로세스 단위: 이미 켜져 있으면 그 설정을 그대로 사용
+        if config.tracing and not tracing.enabled():
+            tracing.configure_tracing(
+                endpoint=config.tracing_endpoint,
+                service_name=config.name,
+                sample_ratio=config.tracing_sample_ratio,
+                slow_threshold=config.tracing_slow_threshold,
+            )
+        self._agent_executor = LangGraphAgentExecutor(
+            executor,
+            self.response_cache,
+            coalesce_requests=config.coalesce_requests,
+            metrics=self.metrics,
+            input_spool_threshold=config.input_spool_threshold,
+            artifact_chunk_size=config.artifact_chunk_size,
+        )
         self._request_handler = DefaultRequestHandler(
             agent_executor=self._agent_executor,
             task_store=self._task_store,
         )
 
+    @staticmethod
+    def _create_worker_pool(executor: BaseExecutor, config: AgentConfig) -> WorkerPool:
+        if config.worker_mode == "thread":
+            return WorkerPool(
+                max_workers=config.worker_pool_size,
+                max_queue=config.worker_queue_size,
+                queue_timeout=config.worker_queue_timeout,
+            )
+        if config.worker_mode != "process":
+            raise ValueError(f"unknown worker_mode: {config.worker_mode!r}")
+        if not isinstance(executor, FunctionExecutor):
+            raise ValueError("worker_mode='process' is only supported for function agents")
+        if executor._is_coroutine or executor._is_async_generator:
+            # async 대상은 이벤트 루프에서 await하므로 프로세스 풀을 거치지 않음
+            raise ValueError("worker_mode='process' requires a sync function or generator, not an async one")
+
+        if config.worker_initializer is not None:
+            ensure_picklable(config.worker_initializer, "worker_initializer")
+        ensure_picklable(config.worker_initargs, "worker_initargs")
+        return ProcessWorkerPool(
+            max_workers=config.worker_pool_size,
+            max_queue=config.worker_queue_size,
+            queue_timeout=config.worker_queue_timeout,
+            initializer=config.worker_initializer,
+            initargs=config.worker_initargs,
+        )
+
+    @staticmethod
+    def _create_task_store(config: AgentConfig) -> TaskStore:
+        if config.task_store_path:
+            return SQLiteTaskStore(config.task_store_path)
+        return BoundedTaskStore(
+            max_entries=config.task_store_max_entries,
+            max_bytes=config.task_store_max_bytes,
+            ttl=config.task_store_ttl,
+            active_ttl=config.task_store_active_ttl,
+        )
+
+    @staticmethod
+    def _create_response_cache(config: AgentConfig) -> Optional[ResponseCache]:
+        if not config.response_cache:
+            return None
+        if config.response_cache_path:
+            backend = DiskCacheBackend(config.response_cache_path, config.response_cache_max_entries)
+        else:
+            backend = MemoryCacheBackend(config.response_cache_max_entries, config.response_cache_max_bytes)
+        return ResponseCache(
+            backend,
+            ttl=config.response_cache_ttl,
+            key_config_keys=config.response_cache_key_config,
+        )
+
     @classmethod
     def from_graph(
         cls,
@@ -134,25 +509,49 @@ class LangGraphA2AAdapter:
         input_key: str = "messages",
         output_key: str = "messages",
         use_langchain_messages: bool = True,
+        stream_tokens: bool = True,
+        task_store: Optional[TaskStore] = None,
+        checkpointer: Any = None,
+        batch_size: int = 1,
+        batch_wait_ms: float = 5.0,
+        output_keys: Optional[List[str]] = None,
+        max_history: Optional[int] = None,
+        max_data_bytes: Optional[int] = None,
     ) -> "LangGraphA2AAdapter":
-        """CompiledStateGraph에서 어댑터 생성."""
+        """CompiledStateGraph에서 어댑터 생성.
+
+        `checkpointer`("memory", SQLite 파일 경로 또는 BaseCheckpointSaver)를 주면 A2A
+        contextId를 thread_id로 사용해 턴마다 새 메시지만 이어 붙입니다.
+        `batch_size` > 1이면 `message/send` 요청을 최대 `batch_wait_ms`ms 동안 모아
+        `graph.abatch`로 한 번에 실행합니다.
+        `output_keys` / `max_history` / `max_data_bytes`로 executor 결과의 `data`에 남길
+        최종 상태를 줄입니다 (A2A 응답은 응답 텍스트만 사용).
+        """
         executor = LangGraphExecutor(
             graph=graph,
             input_key=input_key,
             output_key=output_key,
             use_langchain_messages=use_langchain_messages,
+            stream_tokens=stream_tokens,
+            checkpointer=checkpointer,
+            batch_size=batch_size,
+            batch_wait_ms=batch_wait_ms,
+            output_keys=output_keys,
+            max_history=max_history,
+            max_data_bytes=max_data_bytes,
         )
-        return cls(executor, config)
+        return cls(executor, config, task_store)
 
     @classmethod
     def from_function(
         cls,
         func: Callable[[str], Union[str, dict]],
         config: AgentConfig,
+        task_store: Optional[TaskStore] = None,
     ) -> "LangGraphA2AAdapter":
         """함수에서 어댑터 생성."""
         executor = FunctionExecutor(func)
-        return cls(executor, config)
+        return cls(executor, config, task_store)
 
     @classmethod
     def from_class(
@@ -160,10 +559,25 @@ class LangGraphA2AAdapter:
         instance: Any,
         config: AgentConfig,
         method_name: str = "invoke",
+        task_store: Optional[TaskStore] = None,
     ) -> "LangGraphA2AAdapter":
         """클래스 인스턴스에서 어댑터 생성."""
         executor = ClassExecutor(instance, method_name)
-        return cls(executor, config)
+        return cls(executor, config, task_store)
+
+    @classmethod
+    def from_remote(
+        cls,
+        backends: List[Union[str, BaseExecutor]],
+        config: AgentConfig,
+        task_store: Optional[TaskStore] = None,
+        **router_options: Any,
+    ) -> "LangGraphA2AAdapter":
+        """원격 A2A 에이전트들 앞에 두는 게이트웨이 어댑터 생성 (`RouterExecutor` 옵션 전달)."""
+        from langgraph_a2a_adapters.router import RouterExecutor
+
+        executor = RouterExecutor(backends, **router_options)
+        return cls(executor, config, task_store)
 
     @property
     def app(self):
@@ -172,23 +586,148 @@ class LangGraphA2AAdapter:
         return self._app
 
     def _create_app(self):
+        from a2a.server.apps import A2AFastAPIApplication
+        from a2a.server.apps.jsonrpc.fastapi_app import A2AFastAPI
+        from a2a.utils.constants import AGENT_CARD_WELL_KNOWN_PATH, PREV_AGENT_CARD_WELL_KNOWN_PATH
+
+        from langgraph_a2a_adapters.agent_card import AgentCardEndpoint
+
         agent_card = self.config.to_agent_card()
-        a2a_app = A2AFastAPIApplication(
+        self._a2a_app = A2AFastAPIApplication(
             agent_card=agent_card,
             http_handler=self._request_handler,
         )
-        return a2a_app.build(
+        app = A2AFastAPI(
             title=self.config.name,
             description=self.config.description,
             version=self.config.version,
+            lifespan=self._lifespan,
         )
+        # SDK의 agent card 라우트보다 먼저 등록해 미리 직렬화한 응답을 제공
+        self._card_endpoint = AgentCardEndpoint(agent_card, self.config.agent_card_max_age)
+        for path in (AGENT_CARD_WELL_KNOWN_PATH, PREV_AGENT_CARD_WELL_KNOWN_PATH):
+            app.add_api_route(path, self._card_endpoint, methods=["GET"], include_in_schema=False)
+        self._a2a_app.add_routes_to_app(app)
+        if self.config.stats_endpoint:
+            app.add_api_route("/stats", self.stats, methods=["GET"])
+        if self.metrics is not None:
+            app.add_api_route("/metrics", self._metrics_response, methods=["GET"], include_in_schema=False)
+        return app
+
+    async def _metrics_response(self) -> Response:
+        from fastapi import Response
+
+        return Response(self.metrics.render(), media_type="text/plain; version=0.0.4")
+
+    def invalidate_agent_card(self) -> None:
+        """config 변경 후 agent card를 다시 생성 (ETag도 바뀜)."""
+        if self._a2a_app is None:
+            return
+        agent_card = self.config.to_agent_card()
+        self._a2a_app.agent_card = agent_card
+        self._a2a_app.handler.agent_card = agent_card
+        self._card_endpoint.set_card(agent_card)
+
+    @asynccontextmanager
+    async def _lifespan(self, app):
+        for hook in self._startup_hooks:
+            result = hook(self)
+            if inspect.isawaitable(result):
+                await result
+        yield
+        await self.aclose()
+
+    def on_startup(self, hook: Callable[["LangGraphA2AAdapter"], Any]) -> Callable[["LangGraphA2AAdapter"], Any]:
+        """워커 프로세스마다 서버 시작 시 실행할 훅 등록 (sync/async, 데코레이터로 사용 가능)."""
+        self._startup_hooks.append(hook)
+        return hook
+
+    async def aclose(self) -> None:
+        """실행기, Task 저장소, 캐시, 워커 풀 정리 후 남은 trace 전송."""
+        await self.executor.aclose()
+        if hasattr(self._task_store, "close"):
+            await self._task_store.close()
+        if self.response_cache is not None:
+            await self.response_cache.close()
+        if self._owns_resources:
+            self.resources.clear()
+        if self._owns_worker_pool:
+            self.worker_pool.shutdown(wait=False)
+        await tracing.aflush()
+
+    def stats(self) -> dict:
+        """런타임 사용량 (레플리카 크기 산정용)."""
+        stats = {
+            "worker_pool": self.worker_pool.stats(),
+            "runs": self._agent_executor.runs.stats(),
+            "resources": self.resources.stats(),
+        }
+        if hasattr(self._task_store, "stats"):
+            stats["task_store"] = self._task_store.stats()
+        if self.response_cache is not None:
+            stats["response_cache"] = self.response_cache.stats()
+        if hasattr(self.executor, "stats"):
+            stats["executor"] = self.executor.stats()
+        batcher = getattr(self.executor, "batcher", None)
+        if batcher is not None:
+            stats["batching"] = batcher.stats()
+        if self._agent_executor.coalescer is not None:
+            stats["coalescing"] = self._agent_executor.coalescer.stats()
+        return stats
+
+    def set_port(self, port: int) -> None:
+        if port != self.config.port:
+            self.config.port = port
+            self.invalidate_agent_card()
+
+    def use_shared(self, worker_pool: Optional[WorkerPool] = None, resources: Optional[ResourceCache] = None) -> None:
+        """여러 어댑터가 함께 쓰는 스레드 워커 풀 / 리소스 캐시로 교체 (`A2AHost`용).
+
+        프로세스 풀 모드 어댑터는 자체 워커 풀을 유지합니다.
+        """
+        if worker_pool is not None and self.worker_pool.shares_memory:
+            if self.executor.worker_pool is self.worker_pool:
+                self.executor.worker_pool = worker_pool
+            if worker_pool.metrics is None:
+                worker_pool.metrics = self.worker_pool.metrics
+            self.worker_pool = worker_pool
+            self._owns_worker_pool = False
+        if resources is not None:
+            if self.executor.resources is self.resources:
+                self.executor.resources = resources
+            self.resources = resources
+            self._owns_resources = False
+
+    def prepare_workers(self) -> None:
+        """서빙 전 워커 풀 준비 (프로세스 풀이면 pickle 확인 후 미리 기동)."""
+        if not self.worker_pool.shares_memory:
+            # 데코레이터 적용 시점에는 함수가 모듈에 아직 바인딩되지 않아 여기서 확인
+            ensure_picklable(self.executor.func, "function")
+            self.worker_pool.warmup()
+
+    def serve(
+        self,
+        host: Optional[str] = None,
+        port: Optional[int] = None,
+        workers: int = 1,
+        app_factory: Optional[str] = None,
+        timeout_keep_alive: int = 5,
+        backlog: int = 2048,
+        **uvicorn_options: Any,
+    ):
+        """uvicorn으로 서빙.
+
+        `workers` > 1이면 `app_factory`("module:attr", 어댑터/`@a2a_agent` 함수/팩토리)를
+        워커 프로세스마다 import해 앱을 만듭니다. uvicorn은 기본적으로 uvloop/httptools가
+        설치되어 있으면 사용합니다 (`pip install 'langgraph-a2a-adapters[server]'`).
+        """
+        from langgraph_a2a_adapters import server
 
-    def serve(self, host: Optional[str] = None, port: Optional[int] = None):
         host = host or self.config.host
         port = port or self.config.port
-        self.config.port = port
+        self.set_port(port)
 
         print(f"\n{self.config.name} v{self.config.version}")
-        print(f"http://{host}:{port}\n")
+        print(f"http://{host}:{port} ({workers} worker{'s' if workers > 1 else ''})\n")
 
-        uvicorn.run(self.app, host=host, port=port, log_level="info")
+        server.run(self, host, port, workers, app_factory, timeout_keep_alive, backlog, **uvicorn_options)
@@ -0,0 +1,35 @@
+"""미리 직렬화한 agent card 응답."""
+
+from __future__ import annotations
+
+import hashlib
+
+from a2a.types import AgentCard
+from fastapi import Request, Response
+
+
+class AgentCardEndpoint:
+    """agent card를 한 번만 직렬화해 ETag / Cache-Control과 함께 제공.
+
+    `If-None-Match`가 현재 ETag와 같으면 본문 없이 304를 반환합니다. card가 바뀌면
+    `set_card`로 다시 직렬화합니다.
+    """
+
+    def __init__(self, card: AgentCard, max_age: int = 300):
+        self.max_age = max_age
+        self.set_card(card)
+
+    def set_card(self, card: AgentCard) -> None:
+        self.body = card.model_dump_json(exclude_none=True, by_alias=True).encode()
+        self.etag = f'"{hashlib.sha256(self.body).hexdigest()[:32]}"'
+        self.headers = {"ETag": self.etag, "Cache-Control": f"public, max-age={self.max_age}"}
+
+    async def __call__(self, request: Request) -> Response:
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match and self._matches(if_none_match):
+            return Response(status_code=304, headers=self.headers)
+        return Response(self.body, media_type="application/json", headers=self.headers)
+
+    def _matches(self, if_none_match: str) -> bool:
+        tags = [tag.strip() for tag in if_none_match.split(",")]
+        return "*" in tags or self.etag in tags
@@ -0,0 +1,87 @@
+"""동시 요청 마이크로 배칭."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+
+class MicroBatcher:
+    """동시에 들어온 요청을 모아 한 번에 실행.
+
+    첫 요청 후 `max_wait_ms` 동안 또는 `max_batch_size`개가 찰 때까지 모은 뒤
+    `dispatch(items)`를 호출합니다. `dispatch`는 입력과 같은 순서로 결과 목록을 반환하며,
+    예외 객체인 항목은 해당 요청만 실패시킵니다.
+    """
+
+    def __init__(
+        self,
+        dispatch: Callable[[List[Any]], Awaitable[List[Any]]],
+        max_batch_size: int = 16,
+        max_wait_ms: float = 5.0,
+    ):
+        self.dispatch = dispatch
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+        self._pending: List[Tuple[Any, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._batches = 0
+        self._items = 0
+
+    async def submit(self, item: Any) -> Any:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((item, future))
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait_ms / 1000, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        # 대기 중 취소된 요청은 배치에서 제외
+        batch = [(item, future) for item, future in self._pending if not future.done()]
+        self._pending = []
+        if batch:
+            asyncio.get_running_loop().create_task(self._run(batch))
+
+    async def _run(self, batch: List[Tuple[Any, asyncio.Future]]) -> None:
+        self._batches += 1
+        self._items += len(batch)
+        # 결과를 받지 못한 요청에 전달할 예외 (None이면 배치 실행이 취소됨)
+        error: Optional[BaseException] = None
+        try:
+            results = await self.dispatch([item for item, _ in batch])
+            if len(results) != len(batch):
+                raise RuntimeError(f"dispatch returned {len(results)} results for {len(batch)} items")
+            for (_, future), result in zip(batch, results):
+                if future.done():
+                    continue
+                if isinstance(result, BaseException):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+        except Exception as e:
+            error = e
+        finally:
+            # 취소 등으로 중단돼도 대기 중인 요청이 멈춰 있지 않도록 모두 종료
+            for _, future in batch:
+                if future.done():
+                    continue
+                if error is None:
+                    future.cancel()
+                else:
+                    future.set_exception(error)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "max_batch_size": self.max_batch_size,
+            "max_wait_ms": self.max_wait_ms,
+            "pending": len(self._pending),
+            "batches": self._batches,
+            "items": self._items,
+            "avg_batch_size": self._items / self._batches if self._batches else 0.0,
+        }
@@ -0,0 +1,168 @@
+"""요청 간 재사용 리소스 캐시."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import inspect
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+
+def credential_key(*parts: Optional[str]) -> str:
+    """자격 증명 튜플을 해시한 캐시 키 (원본 키를 캐시 키로 보관하지 않음)."""
+    raw = "\0".join(part or "" for part in parts)
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+def close_resource(resource: Any) -> Any:
+    """리소스의 aclose/close 호출 (코루틴이면 그대로 반환)."""
+    close = getattr(resource, "aclose", None) or getattr(resource, "close", None)
+    return close() if close is not None else None
+
+
+class ResourceCache:
+    """키별 장수명 리소스 캐시.
+
+    최대 `max_size`개를 LRU로 유지하고, `idle_ttl`초 동안 사용되지 않은 리소스는
+    제거합니다. 제거된 리소스는 `close`로 정리합니다. 스레드 안전합니다.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 128,
+        idle_ttl: Optional[float] = 600.0,
+        close: Optional[Callable[[Any], Any]] = close_resource,
+    ):
+        self.max_size = max_size
+        self.idle_ttl = idle_ttl
+        self._close = close
+        self._lock = threading.Lock()
+        # 비동기 close를 예약할 이벤트 루프 (노드가 스레드에서 실행될 때 사용)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # key -> (리소스, 마지막 사용 시각, 리소스 전용 close), 오래 사용되지 않은 순서
+        self._entries: OrderedDict[Hashable, Tuple[Any, float, Optional[Callable[[Any], Any]]]] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get_or_create(
+        self,
+        key: Hashable,
+        factory: Callable[[], Any],
+        close: Optional[Callable[[Any], Any]] = None,
+    ) -> Any:
+        """캐시된 리소스 반환 (없으면 `factory()`로 생성).
+
+        `close`를 주면 제거될 때 캐시의 `close` 대신 호출합니다 (close/aclose가 없는 리소스용).
+        """
+        self.bind_loop()
+        now = time.monotonic()
+        with self._lock:
+            expired = self._pop_idle(now)
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._hits += 1
+                self._entries[key] = (entry[0], now, entry[2])
+                resource = entry[0]
+        self._dispose(expired)
+        if entry is not None:
+            return resource
+
+        resource = factory()
+        with self._lock:
+            self._misses += 1
+            existing = self._entries.pop(key, None)
+            self._entries[key] = (resource, now, close)
+            overflow = []
+            while len(self._entries) > self.max_size:
+                overflow.append(self._entries.popitem(last=False)[1])
+            self._evictions += len(overflow)
+        # 동시에 같은 키로 생성된 경우 먼저 만든 쪽은 정리
+        if existing is not None:
+            overflow.append(existing)
+        self._dispose(overflow)
+        return resource
+
+    def evict_idle(self) -> None:
+        with self._lock:
+            expired = self._pop_idle(time.monotonic())
+        self._dispose(expired)
+
+    def clear(self) -> None:
+        with self._lock:
+            entries = list(self._entries.values())
+            self._entries.clear()
+        self._dispose(entries)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self._hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+        }
+
+    def _pop_idle(self, now: float) -> List[Any]:
+        expired = []
+        if self.idle_ttl is None:
+            return expired
+        while self._entries:
+            key, entry = next(iter(self._entries.items()))
+            if now - entry[1] <= self.idle_ttl:
+                break
+            del self._entries[key]
+            expired.append(entry)
+        self._evictions += len(expired)
+        return expired
+
+    def bind_loop(self) -> None:
+        try:
+            self._loop = asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+
+    def _dispose(self, entries: List[Tuple[Any, float, Optional[Callable[[Any], Any]]]]) -> None:
+        for resource, _, close in entries:
+            close = close or self._close
+            if close is None:
+                continue
+            try:
+                result = close(resource)
+                if inspect.isawaitable(result):
+                    self._schedule(result)
+            except Exception:
+                pass
+
+    def _schedule(self, awaitable: Any) -> None:
+        try:
+            asyncio.get_running_loop().create_task(awaitable)
+            return
+        except RuntimeError:
+            pass
+        if self._loop is not None and self._loop.is_running():
+            asyncio.run_coroutine_threadsafe(awaitable, self._loop)
+        else:
+            asyncio.run(awaitable)
+
+
+# 어댑터 밖(단독 실행, 테스트)에서 사용하는 기본 캐시
+_default_cache = ResourceCache()
+
+
+def get_resource_cache(config: Optional[Dict[str, Any]] = None) -> ResourceCache:
+    """그래프 노드에서 어댑터의 리소스 캐시 조회.
+
+    ```python
+    def chat_node(state, config: RunnableConfig):
+        llm = get_resource_cache(config).get_or_create(
+            credential_key(api_key, base_url, model),
+            lambda: ChatOpenAI(model=model, api_key=api_key, base_url=base_url),
+        )
+    ```
+    """
+    configurable = (config or {}).get("configurable") or {}
+    return configurable.get("resources") or _default_cache
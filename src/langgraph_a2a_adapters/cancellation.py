@@ -0,0 +1,65 @@
+"""실행 중인 요청 취소."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+_cancel_event: ContextVar[Optional[threading.Event]] = ContextVar("a2a_cancel_event", default=None)
+
+
+def is_cancelled() -> bool:
+    """현재 요청이 `tasks/cancel`로 취소되었는지 확인.
+
+    스레드 풀에서 실행되는 sync 함수는 강제로 중단할 수 없으므로, 오래 걸리는 루프에서
+    이 값을 확인해 스스로 종료해야 합니다. (프로세스 풀 모드에서는 항상 False)
+    """
+    event = _cancel_event.get()
+    return event is not None and event.is_set()
+
+
+class RunRegistry:
+    """task_id별로 실행 중인 asyncio Task와 취소 플래그를 추적."""
+
+    def __init__(self):
+        self._runs: Dict[str, Tuple[Optional[asyncio.Task], threading.Event, float]] = {}
+        self._cancelled = 0
+        self._cancelled_seconds = 0.0
+
+    @contextmanager
+    def track(self, task_id: str) -> Iterator[threading.Event]:
+        event = threading.Event()
+        self._runs[task_id] = (asyncio.current_task(), event, time.monotonic())
+        token = _cancel_event.set(event)
+        try:
+            yield event
+        finally:
+            _cancel_event.reset(token)
+            self._runs.pop(task_id, None)
+
+    def cancel(self, task_id: str) -> bool:
+        """실행 중이면 취소 플래그를 세우고 asyncio Task를 취소."""
+        run = self._runs.pop(task_id, None)
+        if run is None:
+            return False
+
+        task, event, started = run
+        event.set()
+        if task is not None and task is not asyncio.current_task():
+            task.cancel()
+        self._cancelled += 1
+        self._cancelled_seconds += time.monotonic() - started
+        return True
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "running": len(self._runs),
+            "cancelled": self._cancelled,
+            # 취소 시점까지 실행된 시간 합계 (절약된 시간이 아님: 협력적으로 종료하지 않는
+            # sync 함수는 취소 후에도 계속 실행되며, 이런 작업은 worker_pool의 detached에 표시)
+            "elapsed_before_cancel_seconds": round(self._cancelled_seconds, 3),
+        }
@@ -0,0 +1,63 @@
+"""동일한 동시 요청 병합 (single-flight)."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Tuple
+
+
+class SingleFlight:
+    """같은 키의 실행이 진행 중이면 새로 실행하지 않고 그 결과를 공유.
+
+    먼저 도착한 요청(leader)만 실행하고, 이후 요청(follower)은 같은 결과의 복사본을
+    받습니다. leader가 취소되면 대기하던 follower 중 하나가 다시 실행합니다.
+    """
+
+    def __init__(self):
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._leaders = 0
+        self._coalesced = 0
+
+    async def run(self, key: str, func: Callable[[], Awaitable[Any]]) -> Tuple[Any, bool]:
+        """(결과, 공유 여부) 반환. 공유 여부가 True면 다른 요청의 결과."""
+        while True:
+            future = self._inflight.get(key)
+            if future is None:
+                break
+            try:
+                result = await asyncio.shield(future)
+            except asyncio.CancelledError:
+                # 이 요청 자체가 취소된 경우만 전파, leader 취소면 다시 시도
+                if not future.cancelled():
+                    raise
+                continue
+            # leader의 예외를 함께 받은 follower는 세지 않음 (결과를 공유받은 요청만)
+            self._coalesced += 1
+            return (dict(result) if isinstance(result, dict) else result), True
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        self._leaders += 1
+        try:
+            result = await func()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # follower가 없을 때 "exception was never retrieved" 경고 방지
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result, False
+        finally:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "in_flight": len(self._inflight),
+            "executed": self._leaders,
+            "coalesced": self._coalesced,
+        }
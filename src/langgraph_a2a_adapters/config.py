@@ -1,13 +1,17 @@
 """A2A 설정 클래스."""
 
+from __future__ import annotations
+
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import TYPE_CHECKING, Any, Callable, List, Optional, Tuple
 
-from a2a.types import (
-    AgentCapabilities as A2AAgentCapabilities,
-    AgentCard as A2AAgentCard,
-    AgentSkill as A2AAgentSkill,
-)
+if TYPE_CHECKING:
+    # pydantic 모델은 agent card를 만들 때만 import (설정만 읽는 코드의 시작 시간 단축)
+    from a2a.types import (
+        AgentCapabilities as A2AAgentCapabilities,
+        AgentCard as A2AAgentCard,
+        AgentSkill as A2AAgentSkill,
+    )
 
 
 @dataclass
@@ -23,6 +27,8 @@ class AgentSkill:
     output_modes: List[str] = field(default_factory=lambda: ["text/plain"])
 
     def to_sdk(self) -> A2AAgentSkill:
+        from a2a.types import AgentSkill as A2AAgentSkill
+
         return A2AAgentSkill(
             id=self.id,
             name=self.name,
@@ -43,6 +49,8 @@ class AgentCapabilities:
     state_transition_history: bool = False
 
     def to_sdk(self) -> A2AAgentCapabilities:
+        from a2a.types import AgentCapabilities as A2AAgentCapabilities
+
         return A2AAgentCapabilities(
             streaming=self.streaming,
             pushNotifications=self.push_notifications,
@@ -64,6 +72,55 @@ class AgentConfig:
     capabilities: AgentCapabilities = field(default_factory=AgentCapabilities)
     default_input_modes: List[str] = field(default_factory=lambda: ["text/plain"])
     default_output_modes: List[str] = field(default_factory=lambda: ["text/plain"])
+    # 동기 함수/그래프 실행용 워커 풀 (None이면 thread: min(32, CPU + 4), process: CPU 수)
+    worker_pool_size: Optional[int] = None
+    worker_queue_size: int = 100
+    worker_queue_timeout: Optional[float] = 30.0
+    # "thread" 또는 "process" (CPU 바운드 함수용, from_function / a2a_agent 전용)
+    worker_mode: str = "thread"
+    worker_initializer: Optional[Callable[..., Any]] = None
+    worker_initargs: Tuple[Any, ...] = ()
+    # 종료된 Task 보관 한도 (None이면 제한 없음)
+    task_store_max_entries: Optional[int] = 10_000
+    task_store_max_bytes: Optional[int] = 256 * 1024 * 1024
+    task_store_ttl: Optional[float] = 3600.0
+    # 진행 중인 Task가 이 시간(초) 동안 갱신되지 않으면 제거 (None이면 제한 없음)
+    task_store_active_ttl: Optional[float] = 24 * 3600.0
+    # 지정하면 SQLite 파일에 Task 저장 (재시작 후에도 tasks/get 가능)
+    task_store_path: Optional[str] = None
+    # 테넌트별 LLM 클라이언트 등 재사용 리소스 캐시
+    resource_cache_size: int = 128
+    resource_cache_ttl: Optional[float] = 600.0
+    # 결정적 에이전트용 응답 캐시 (적중 시 그래프/LLM 호출 생략)
+    response_cache: bool = False
+    response_cache_ttl: float = 300.0
+    response_cache_max_entries: Optional[int] = 1000
+    response_cache_max_bytes: Optional[int] = 64 * 1024 * 1024
+    # 지정하면 SQLite 파일에 응답 캐시 저장
+    response_cache_path: Optional[str] = None
+    # 캐시 키에 포함할 api_config 키 (None이면 모든 X- 헤더)
+    # 목록을 지정하면 나머지 헤더가 다른 테넌트도 같은 캐시 항목을 공유함 (예: ["OPENAI_MODEL"])
+    response_cache_key_config: Optional[List[str]] = None
+    # 같은 입력/스킬/X- 헤더의 동시 요청을 한 번만 실행하고 결과 공유
+    coalesce_requests: bool = False
+    # agent card 응답의 Cache-Control max-age (초)
+    agent_card_max_age: int = 300
+    # GET /stats로 풀 / Task 저장소 / 캐시 내부 상태 노출 (인증이 없으므로 기본 꺼짐)
+    stats_endpoint: bool = False
+    # 단계별/노드별 지연 시간을 Prometheus 형식으로 GET /metrics에 노출
+    metrics: bool = False
+    # 이보다 큰 파일 파트는 메모리 대신 임시 파일에 보관 (바이트)
+    input_spool_threshold: int = 1024 * 1024
+    # message/stream에서 긴 응답을 나눠 보내는 artifact 조각 크기 (문자 수)
+    artifact_chunk_size: int = 64 * 1024
+    # OpenTelemetry 트레이싱 (요청 / execute / 그래프 노드 / 원격 에이전트 호출 span)
+    tracing: bool = False
+    # OTLP/HTTP 수집 주소 (None이면 OTEL_EXPORTER_OTLP_* 환경변수 사용)
+    tracing_endpoint: Optional[str] = None
+    # head 샘플링 비율 (상위 에이전트의 샘플링 결정이 있으면 그대로 따름)
+    tracing_sample_ratio: float = 1.0
+    # tail 샘플링: 지정하면 이 시간(초) 이상 걸렸거나 실패한 trace만 전송
+    tracing_slow_threshold: Optional[float] = None
 
     def __post_init__(self):
         if not self.skills:
@@ -79,6 +136,8 @@ class AgentConfig:
         return self.url or f"http://localhost:{self.port}"
 
     def to_agent_card(self) -> A2AAgentCard:
+        from a2a.types import AgentCard as A2AAgentCard
+
         return A2AAgentCard(
             name=self.name,
             description=self.description,
@@ -2,12 +2,27 @@
 
 from __future__ import annotations
 
-from typing import Callable, List, Optional
+from typing import Any, Callable, List, Optional, Tuple
 
-from langgraph_a2a_adapters.adapter import LangGraphA2AAdapter
 from langgraph_a2a_adapters.config import AgentConfig, AgentSkill
 
 
+class _LazyApp:
+    """처음 호출(또는 속성 접근)될 때 어댑터의 ASGI 앱을 만드는 프록시.
+
+    데코레이터를 적용한 모듈을 import할 때 FastAPI 서버 스택을 바로 불러오지 않습니다.
+    """
+
+    def __init__(self, adapter: Any):
+        self._adapter = adapter
+
+    async def __call__(self, scope: Any, receive: Any, send: Any) -> None:
+        await self._adapter.app(scope, receive, send)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._adapter.app, name)
+
+
 def a2a_agent(
     name: str,
     description: str = "",
@@ -15,10 +30,18 @@ def a2a_agent(
     host: str = "0.0.0.0",
     skills: Optional[List[AgentSkill]] = None,
     version: str = "1.0.0",
+    worker_mode: str = "thread",
+    worker_initializer: Optional[Callable[..., Any]] = None,
+    worker_initargs: Tuple[Any, ...] = (),
 ):
-    """함수를 A2A 에이전트로 변환."""
+    """함수를 A2A 에이전트로 변환.
+
+    CPU 바운드 함수는 `worker_mode="process"`로 워커 프로세스에서 실행합니다.
+    """
 
     def decorator(func: Callable):
+        from langgraph_a2a_adapters.adapter import LangGraphA2AAdapter
+
         config = AgentConfig(
             name=name,
             description=description or func.__doc__ or "",
@@ -33,12 +56,15 @@ def a2a_agent(
                     description=description or func.__doc__ or f"{name} 기능",
                 )
             ],
+            worker_mode=worker_mode,
+            worker_initializer=worker_initializer,
+            worker_initargs=worker_initargs,
         )
 
         adapter = LangGraphA2AAdapter.from_function(func, config)
 
         func.serve = adapter.serve
-        func.app = adapter.app
+        func.app = _LazyApp(adapter)
         func.adapter = adapter
         func.config = config
 
@@ -62,6 +88,8 @@ def a2a_class(
         original_init = cls.__init__
 
         def new_init(self, *args, **kwargs):
+            from langgraph_a2a_adapters.adapter import LangGraphA2AAdapter
+
             original_init(self, *args, **kwargs)
 
             config = AgentConfig(
@@ -83,7 +111,7 @@ def a2a_class(
             adapter = LangGraphA2AAdapter.from_class(self, config, method_name)
 
             self.serve = adapter.serve
-            self.app = adapter.app
+            self.app = _LazyApp(adapter)
             self.adapter = adapter
             self.config = config
 
@@ -3,36 +3,97 @@
 from __future__ import annotations
 
 import asyncio
+import contextvars
+import inspect
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import Any, AsyncIterator, Dict, List, Optional
+from contextlib import nullcontext
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Dict, Iterator, List, Optional, Tuple
 
-from langgraph.graph.state import CompiledStateGraph
+from langgraph_a2a_adapters import tracing
+from langgraph_a2a_adapters.batching import MicroBatcher
+from langgraph_a2a_adapters.cache import ResourceCache
+from langgraph_a2a_adapters.pool import WorkerPool
+
+if TYPE_CHECKING:
+    from langgraph.graph.state import CompiledStateGraph
+
+    from langgraph_a2a_adapters.metrics import Metrics
+
+
+def _build_langfuse_handler(public_key: str, secret_key: str, host: str) -> Tuple[Any, Any]:
+    from langfuse import Langfuse
+    from langfuse.langchain import CallbackHandler
+
+    client = Langfuse(public_key=public_key, secret_key=secret_key, host=host)
+    return CallbackHandler(public_key=public_key), client
+
+
+def _flush_langfuse(entry: Tuple[Any, Any]) -> None:
+    # flush는 네트워크 대기가 있어 이벤트 루프를 막지 않도록 별도 스레드에서 실행
+    # Langfuse v3는 public key별 리소스(exporter, 스레드)를 프로세스 전역에 등록하고 shutdown해도
+    # 해제하지 않으므로, shutdown하면 같은 public key로 다시 만든 클라이언트가 데이터를 보내지 못함
+    threading.Thread(target=entry[1].flush, name="langfuse-flush", daemon=True).start()
+
+
+# public key별 Langfuse 핸들러 (요청마다 클라이언트/flush 스레드를 새로 만들지 않음)
+# Langfuse가 public key당 클라이언트 하나만 유지하므로 같은 public key는 처음 사용한 secret key / host를 따름
+_langfuse_handlers = ResourceCache(max_size=32, idle_ttl=600.0, close=_flush_langfuse)
 
 
 def _create_langfuse_callback(api_config: Dict[str, Any]) -> Optional[Any]:
-    """api_config에서 Langfuse 콜백 핸들러 생성."""
+    """api_config에서 Langfuse 콜백 핸들러 조회 (자격 증명별로 캐시)."""
     secret_key = api_config.get('LANGFUSE_SECRET_KEY')
     public_key = api_config.get('LANGFUSE_PUBLIC_KEY')
 
     if not secret_key or not public_key:
         return None
 
+    host = api_config.get('LANGFUSE_BASE_URL', 'https://cloud.langfuse.com')
     try:
-        from langfuse.langchain import CallbackHandler
-        return CallbackHandler(
-            secret_key=secret_key,
-            public_key=public_key,
-            host=api_config.get('LANGFUSE_BASE_URL', 'https://cloud.langfuse.com'),
+        handler, _ = _langfuse_handlers.get_or_create(
+            public_key,
+            lambda: _build_langfuse_handler(public_key, secret_key, host),
         )
+        return handler
     except ImportError:
         return None
     except Exception:
         return None
 
 
+def _create_checkpointer(checkpointer: Any) -> Any:
+    """"memory" 또는 BaseCheckpointSaver로 체크포인터 생성 (SQLite 경로는 `_create_sqlite_saver`)."""
+    if not isinstance(checkpointer, str):
+        return checkpointer
+    from langgraph.checkpoint.memory import InMemorySaver
+    return InMemorySaver()
+
+
+def _create_sqlite_saver(path: str) -> Any:
+    """SQLite 파일 체크포인터 (실행 중인 이벤트 루프 안에서 호출)."""
+    try:
+        import aiosqlite
+        from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
+    except ImportError as e:
+        raise ImportError(
+            "SQLite checkpointer requires langgraph-checkpoint-sqlite "
+            "(pip install 'langgraph-a2a-adapters[sqlite]')"
+        ) from e
+    return AsyncSqliteSaver(aiosqlite.connect(path))
+
+
 class BaseExecutor(ABC):
     """에이전트 실행기 인터페이스."""
 
+    # 동기 작업을 실행할 풀. None이면 asyncio 기본 executor 사용
+    worker_pool: Optional[WorkerPool] = None
+    # 요청 간 재사용할 LLM 클라이언트 등 (그래프에는 configurable["resources"]로 전달)
+    resources: Optional[ResourceCache] = None
+    # 어댑터가 메트릭을 켜면 노드별 실행 시간을 기록
+    metrics: Optional[Metrics] = None
+
     @abstractmethod
     def invoke(self, query: str, session_id: Optional[str] = None, api_config: Optional[Dict[str, Any]] = None, **kwargs) -> Dict[str, Any]:
         pass
@@ -41,20 +102,27 @@ class BaseExecutor(ABC):
     async def ainvoke(self, query: str, session_id: Optional[str] = None, api_config: Optional[Dict[str, Any]] = None, **kwargs) -> Dict[str, Any]:
         pass
 
-    async def astream(self, query: str, session_id: Optional[str] = None, api_config: Optional[Dict[str, Any]] = None, **kwargs) -> AsyncIterator[Dict[str, Any]]:
-        result = await self.ainvoke(query, session_id, **kwargs)
-        content = result.get("content", "")
-
-        words = content.split() if content else []
-        for i, word in enumerate(words):
-            yield {
-                "is_task_complete": False,
-                "require_user_input": False,
-                "content": word + (" " if i < len(words) - 1 else ""),
-            }
-            await asyncio.sleep(0.02)
+    async def aclose(self) -> None:
+        """실행기가 연 커넥션 등 정리 (어댑터 종료 시 호출)."""
+        return None
 
-        yield {"is_task_complete": True, "require_user_input": False, "content": ""}
+    async def astream(self, query: str, session_id: Optional[str] = None, api_config: Optional[Dict[str, Any]] = None, **kwargs) -> AsyncIterator[Dict[str, Any]]:
+        """응답 청크 스트리밍.
+
+        `delta=True` 청크는 이어 붙일 응답 조각이고, 마지막 청크(`is_task_complete=True`)의
+        `content`는 최종 응답 전체입니다.
+        """
+        result = await self.ainvoke(query, session_id, api_config, **kwargs)
+        yield {"is_task_complete": True, "require_user_input": False, "content": result.get("content", "")}
+
+    async def _run_sync(self, func: Callable[..., Any], *args: Any) -> Any:
+        # 스레드에서도 is_cancelled()가 현재 요청의 취소 플래그를 보도록 컨텍스트 전달
+        if self.worker_pool is None or self.worker_pool.shares_memory:
+            func, args = contextvars.copy_context().run, (func, *args)
+        if self.worker_pool is not None:
+            return await self.worker_pool.run(func, *args)
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, func, *args)
 
 
 class LangGraphExecutor(BaseExecutor):
@@ -66,12 +134,38 @@ class LangGraphExecutor(BaseExecutor):
         input_key: str = "messages",
         output_key: str = "messages",
         use_langchain_messages: bool = True,
+        stream_tokens: bool = True,
+        checkpointer: Any = None,
+        batch_size: int = 1,
+        batch_wait_ms: float = 5.0,
+        output_keys: Optional[List[str]] = None,
+        max_history: Optional[int] = None,
+        max_data_bytes: Optional[int] = None,
     ):
+        # 체크포인터가 있으면 session_id(contextId)별로 대화 상태를 이어감
+        # SQLite 경로는 AsyncSqliteSaver가 생성 시점의 이벤트 루프에 묶이므로 첫 비동기 호출 때 생성
+        self._sqlite_path: Optional[str] = None
+        self._sqlite_loop: Optional[asyncio.AbstractEventLoop] = None
+        if isinstance(checkpointer, str) and checkpointer != "memory":
+            self._sqlite_path = checkpointer
+        elif checkpointer is not None:
+            graph = graph.copy(update={"checkpointer": _create_checkpointer(checkpointer)})
         self.graph = graph
         self.input_key = input_key
         self.output_key = output_key
         self.use_langchain_messages = use_langchain_messages
+        self.stream_tokens = stream_tokens
+        # 응답 "data"에 남길 상태 (None이면 전체 상태, []이면 data 없음)
+        self.output_keys = output_keys
+        # data의 리스트 값(메시지 등)은 마지막 max_history개만 유지
+        self.max_history = max_history
+        # data 크기 추정치가 이보다 크면 data를 버리고 data_truncated=True 표시
+        self.max_data_bytes = max_data_bytes
         self._langchain_available = self._check_langchain()
+        # batch_size > 1이면 동시 ainvoke 요청을 모아 graph.abatch 한 번으로 실행
+        self.batcher = None
+        if batch_size > 1 and hasattr(graph, "abatch"):
+            self.batcher = MicroBatcher(self._dispatch_batch, batch_size, batch_wait_ms)
 
     def _check_langchain(self) -> bool:
         if not self.use_langchain_messages:
@@ -96,14 +190,27 @@ class LangGraphExecutor(BaseExecutor):
 
     def _prepare_config(self, session_id: Optional[str] = None, api_config: Optional[Dict[str, Any]] = None, **kwargs) -> Dict[str, Any]:
         config = {}
+        configurable = {}
         if session_id:
-            config["configurable"] = {"thread_id": session_id}
-
+            configurable["thread_id"] = session_id
+        if self.resources is not None:
+            self.resources.bind_loop()
+            configurable["resources"] = self.resources
+        if configurable:
+            config["configurable"] = configurable
+
+        callbacks = []
         # Langfuse 콜백 자동 추가
         if api_config:
             langfuse_callback = _create_langfuse_callback(api_config)
             if langfuse_callback:
-                config["callbacks"] = [langfuse_callback]
+                callbacks.append(langfuse_callback)
+        # 트레이싱을 켜면 노드별 span (현재 execute span의 자식)
+        node_callback = tracing.node_callback()
+        if node_callback is not None:
+            callbacks.append(node_callback)
+        if callbacks:
+            config["callbacks"] = callbacks
 
         config.update(kwargs)
         return config
@@ -111,17 +218,77 @@ class LangGraphExecutor(BaseExecutor):
     def _extract_response(self, result: Dict[str, Any]) -> Dict[str, Any]:
         output = result.get(self.output_key, result)
 
-        if isinstance(output, list) and output:
-            last_message = output[-1]
-            if hasattr(last_message, "content"):
-                return {"content": last_message.content, "data": result, "is_task_complete": True}
-
-        if isinstance(output, str):
-            return {"content": output, "data": result, "is_task_complete": True}
-
-        return {"content": str(output), "data": result, "is_task_complete": True}
+        if isinstance(output, list) and output and hasattr(output[-1], "content"):
+            content = output[-1].content
+        elif isinstance(output, str):
+            content = output
+        else:
+            content = str(output)
+
+        response = {"content": content, "is_task_complete": True}
+        data = self._project(result)
+        if data is not None:
+            response["data"] = data
+        elif self.max_data_bytes is not None and self.output_keys != []:
+            response["data_truncated"] = True
+        return response
+
+    def _project(self, result: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """설정한 키 / 히스토리 길이 / 크기로 줄인 최종 상태 (없으면 None).
+
+        선택하지 않은 중간 상태(검색 결과 등)는 응답에 남지 않아 요청이 끝나기 전에 해제됩니다.
+        """
+        if self.output_keys is None and self.max_history is None and self.max_data_bytes is None:
+            return result
+        if self.output_keys == []:
+            return None
+
+        keys = result.keys() if self.output_keys is None else [key for key in self.output_keys if key in result]
+        data = {}
+        for key in keys:
+            value = result[key]
+            if self.max_history is not None and isinstance(value, list):
+                value = value[-self.max_history:] if self.max_history > 0 else []
+            data[key] = value
+
+        if self.max_data_bytes is not None and _approx_size(data) > self.max_data_bytes:
+            return None
+        return data
+
+    @property
+    def has_checkpointer(self) -> bool:
+        return self._sqlite_path is not None or getattr(self.graph, "checkpointer", None) is not None
+
+    async def _bind_checkpointer(self) -> None:
+        # 현재 이벤트 루프용 SQLite 체크포인터 (루프가 바뀌면 새로 만들고 이전 커넥션은 닫음)
+        if self._sqlite_path is None:
+            return
+        loop = asyncio.get_running_loop()
+        if self._sqlite_loop is loop:
+            return
+        previous = self.graph.checkpointer if self._sqlite_loop is not None else None
+        self.graph = self.graph.copy(update={"checkpointer": _create_sqlite_saver(self._sqlite_path)})
+        self._sqlite_loop = loop
+        if previous is not None:
+            await previous.conn.close()
+
+    async def aclose(self) -> None:
+        # ainvoke / astream이 연 SQLite 커넥션은 같은 이벤트 루프에서 닫아야 인터프리터가 종료됨
+        if self._sqlite_loop is not None:
+            self._sqlite_loop = None
+            await self.graph.checkpointer.conn.close()
 
     def invoke(self, query: str, session_id: Optional[str] = None, api_config: Optional[Dict[str, Any]] = None, **kwargs) -> Dict[str, Any]:
+        if self._sqlite_path is not None:
+            # AsyncSqliteSaver는 동기 graph.invoke를 이벤트 루프 스레드 밖에서만 지원
+            # 임시 루프에서 연 aiosqlite 커넥션(비데몬 스레드)은 같은 루프에서 닫아야 종료 시 멈추지 않음
+            async def run_once() -> Dict[str, Any]:
+                try:
+                    return await self.ainvoke(query, session_id, api_config, **kwargs)
+                finally:
+                    await self.aclose()
+
+            return asyncio.run(run_once())
         input_data = self._prepare_input(query, session_id, api_config)
         config = self._prepare_config(session_id, api_config, **kwargs)
         result = self.graph.invoke(input_data, config if config else None)
@@ -130,25 +297,72 @@ class LangGraphExecutor(BaseExecutor):
     async def ainvoke(self, query: str, session_id: Optional[str] = None, api_config: Optional[Dict[str, Any]] = None, **kwargs) -> Dict[str, Any]:
         input_data = self._prepare_input(query, session_id, api_config)
         config = self._prepare_config(session_id, api_config, **kwargs)
+        await self._bind_checkpointer()
 
-        if hasattr(self.graph, "ainvoke"):
+        if self.batcher is not None:
+            result = await self.batcher.submit((input_data, config))
+        elif hasattr(self.graph, "ainvoke"):
             result = await self.graph.ainvoke(input_data, config if config else None)
         else:
-            loop = asyncio.get_event_loop()
-            result = await loop.run_in_executor(
-                None, lambda: self.graph.invoke(input_data, config if config else None)
+            result = await self._run_sync(
+                lambda: self.graph.invoke(input_data, config if config else None)
             )
         return self._extract_response(result)
 
+    async def _dispatch_batch(self, items: List[Tuple[Dict[str, Any], Dict[str, Any]]]) -> List[Any]:
+        inputs = [input_data for input_data, _ in items]
+        configs = [config for _, config in items]
+        # 항목별 예외는 결과 목록에 담겨 해당 요청만 실패
+        return await self.graph.abatch(inputs, configs, return_exceptions=True)
+
     async def astream(self, query: str, session_id: Optional[str] = None, api_config: Optional[Dict[str, Any]] = None, **kwargs) -> AsyncIterator[Dict[str, Any]]:
         input_data = self._prepare_input(query, session_id, api_config)
         config = self._prepare_config(session_id, api_config, **kwargs)
+        await self._bind_checkpointer()
 
-        if hasattr(self.graph, "astream"):
-            async for chunk in self.graph.astream(input_data, config if config else None):
-                for node_name, node_output in chunk.items():
+        if not hasattr(self.graph, "astream"):
+            async for chunk in super().astream(query, session_id, api_config, **kwargs):
+                yield chunk
+            return
+
+        # "values"는 superstep마다 전체 상태를 내보내므로 쓰지 않고 updates에서 최종 출력을 추적
+        stream_mode = ["updates"]
+        if self.stream_tokens:
+            stream_mode.append("messages")
+        metrics = self.metrics
+        if metrics is not None:
+            stream_mode.append("tasks")
+            # task id -> 시작 시각
+            node_started: Dict[str, float] = {}
+
+        # 토큰을 스트리밍한 노드는 updates 단계에서 같은 내용을 다시 보내지 않음
+        token_nodes = set()
+        last_output = None
+        async for mode, data in self.graph.astream(input_data, config if config else None, stream_mode=stream_mode):
+            if mode == "messages":
+                message, metadata = data
+                if not self._is_message_chunk(message):
+                    continue
+                content = self._message_text(message.content)
+                if content:
+                    node_name = metadata.get("langgraph_node")
+                    token_nodes.add(node_name)
+                    yield {
+                        "is_task_complete": False,
+                        "require_user_input": False,
+                        "content": content,
+                        "node": node_name,
+                        "delta": True,
+                    }
+            elif mode == "updates":
+                for node_name, node_output in data.items():
                     if node_name == "__end__":
                         continue
+                    if isinstance(node_output, dict) and self.output_key in node_output:
+                        last_output = node_output[self.output_key]
+                    if node_name in token_nodes:
+                        token_nodes.discard(node_name)
+                        continue
                     content = self._extract_content_from_chunk(node_output)
                     if content:
                         yield {
@@ -157,10 +371,51 @@ class LangGraphExecutor(BaseExecutor):
                             "content": content,
                             "node": node_name,
                         }
-            yield {"is_task_complete": True, "require_user_input": False, "content": ""}
-        else:
-            async for chunk in super().astream(query, session_id, **kwargs):
-                yield chunk
+            elif mode == "tasks":
+                if "result" in data or "error" in data:
+                    started = node_started.pop(data["id"], None)
+                    if started is not None:
+                        metrics.observe("a2a_node_seconds", time.perf_counter() - started, node=data["name"])
+                else:
+                    node_started[data["id"]] = time.perf_counter()
+
+        content = await self._final_content(last_output, config)
+        # 마지막 청크를 넘긴 뒤에도 제너레이터가 최종 출력을 붙잡고 있지 않도록 해제
+        last_output = None
+        yield {"is_task_complete": True, "require_user_input": False, "content": content}
+
+    async def _final_content(self, last_output: Any, config: Dict[str, Any]) -> str:
+        """스트리밍 후 최종 응답 텍스트.
+
+        체크포인터가 있으면 reducer가 적용된 최종 상태를 한 번 조회하고, 없으면 output_key를
+        마지막으로 갱신한 노드의 출력을 사용합니다.
+        """
+        if self.has_checkpointer and (config.get("configurable") or {}).get("thread_id"):
+            snapshot = await self.graph.aget_state(config)
+            return self._extract_response(snapshot.values)["content"] if snapshot.values else ""
+        if last_output is None:
+            return ""
+        return self._extract_response({self.output_key: last_output})["content"]
+
+    @staticmethod
+    def _is_message_chunk(message: Any) -> bool:
+        try:
+            from langchain_core.messages import AIMessageChunk
+        except ImportError:
+            return False
+        return isinstance(message, AIMessageChunk)
+
+    @staticmethod
+    def _message_text(content: Any) -> str:
+        if isinstance(content, str):
+            return content
+        if isinstance(content, list):
+            return "".join(
+                block if isinstance(block, str) else block.get("text", "")
+                for block in content
+                if isinstance(block, (str, dict))
+            )
+        return ""
 
     def _extract_content_from_chunk(self, chunk: Any) -> str:
         if isinstance(chunk, dict):
@@ -178,22 +433,122 @@ class LangGraphExecutor(BaseExecutor):
         return ""
 
 
-class FunctionExecutor(BaseExecutor):
-    """함수 기반 실행기."""
+def _approx_size(value: Any) -> int:
+    """직렬화 크기의 대략적인 추정 (바이트, 문자열 길이 위주)."""
+    size = 0
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, (str, bytes)):
+            size += len(item)
+        elif isinstance(item, dict):
+            size += sum(len(str(key)) for key in item)
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple)):
+            stack.extend(item)
+        elif hasattr(item, "content"):
+            # LangChain 메시지
+            stack.append(item.content)
+            size += 64
+        else:
+            size += 8
+    return size
+
+
+def _piece_text(piece: Any) -> str:
+    if isinstance(piece, str):
+        return piece
+    if isinstance(piece, dict):
+        return piece.get("response") or piece.get("content") or ""
+    return str(piece) if piece is not None else ""
 
-    def __init__(self, func):
-        self.func = func
+
+def _call_target(target: Callable[..., Any], query: str, kwargs: Dict[str, Any]) -> Any:
+    try:
+        return target(query, **kwargs) if kwargs else target(query)
+    except TypeError:
+        return target(query)
+
+
+def _invoke_target(target: Callable[..., Any], query: str, kwargs: Dict[str, Any]) -> Any:
+    """sync 대상을 끝까지 실행 (워커 프로세스에서도 호출되므로 모듈 수준 함수)."""
+    result = _call_target(target, query, kwargs)
+    if inspect.isgenerator(result):
+        result = "".join(_piece_text(piece) for piece in result)
+    return result
+
+
+class _CallableExecutor(BaseExecutor):
+    """함수/메서드 호출 공통 실행기.
+
+    async 대상은 이벤트 루프에서 바로 await하고, sync 대상만 스레드에서 실행합니다.
+    대상이 sync/async 제너레이터면 yield된 조각을 그대로 스트리밍합니다.
+    """
+
+    def __init__(self, target: Callable[..., Any]):
+        self._target = target
+        self._is_coroutine = inspect.iscoroutinefunction(target) or inspect.iscoroutinefunction(
+            getattr(target, "__call__", None)
+        )
+        self._is_async_generator = inspect.isasyncgenfunction(target)
+
+    def _call(self, query: str, **kwargs) -> Any:
+        return _call_target(self._target, query, kwargs)
 
     def invoke(self, query: str, session_id: Optional[str] = None, api_config: Optional[Dict[str, Any]] = None, **kwargs) -> Dict[str, Any]:
-        try:
-            result = self.func(query, **kwargs) if kwargs else self.func(query)
-        except TypeError:
-            result = self.func(query)
-        return self._normalize_result(result)
+        if self._is_coroutine or self._is_async_generator:
+            return asyncio.run(self.ainvoke(query, session_id, api_config, **kwargs))
+
+        return self._normalize_result(_invoke_target(self._target, query, kwargs))
 
     async def ainvoke(self, query: str, session_id: Optional[str] = None, api_config: Optional[Dict[str, Any]] = None, **kwargs) -> Dict[str, Any]:
+        if self._is_coroutine:
+            return self._normalize_result(await self._call(query, **kwargs))
+
+        if self._is_async_generator:
+            pieces = [_piece_text(piece) async for piece in self._call(query, **kwargs)]
+            return self._normalize_result("".join(pieces))
+
+        result = await self._run_sync(_invoke_target, self._target, query, kwargs)
+        return self._normalize_result(result)
+
+    async def astream(self, query: str, session_id: Optional[str] = None, api_config: Optional[Dict[str, Any]] = None, **kwargs) -> AsyncIterator[Dict[str, Any]]:
+        if self._is_async_generator:
+            pieces = self._call(query, **kwargs)
+        elif inspect.isgeneratorfunction(self._target) and (
+            self.worker_pool is None or self.worker_pool.shares_memory
+        ):
+            pieces = self._iterate_in_thread(lambda: self._call(query, **kwargs))
+        else:
+            async for chunk in super().astream(query, session_id, api_config, **kwargs):
+                yield chunk
+            return
+
+        contents = []
+        async for piece in pieces:
+            content = _piece_text(piece)
+            if not content:
+                continue
+            contents.append(content)
+            yield {
+                "is_task_complete": False,
+                "require_user_input": False,
+                "content": content,
+                "delta": True,
+            }
+        yield {"is_task_complete": True, "require_user_input": False, "content": "".join(contents)}
+
+    async def _iterate_in_thread(self, create: Callable[[], Iterator[Any]]) -> AsyncIterator[Any]:
+        # 제너레이터 한 단계씩 스레드에서 실행해 이벤트 루프를 막지 않음
+        # 워커 풀이 있으면 스트림이 끝날 때까지 슬롯 하나를 점유
         loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, lambda: self.invoke(query, session_id, api_config, **kwargs))
+        done = object()
+        slot = self.worker_pool.slot() if self.worker_pool is not None else nullcontext()
+        context = contextvars.copy_context()
+        async with slot as executor:
+            generator = create()
+            while (piece := await loop.run_in_executor(executor, context.run, next, generator, done)) is not done:
+                yield piece
 
     def _normalize_result(self, result: Any) -> Dict[str, Any]:
         if isinstance(result, dict):
@@ -202,27 +557,19 @@ class FunctionExecutor(BaseExecutor):
         return {"content": str(result), "is_task_complete": True}
 
 
-class ClassExecutor(BaseExecutor):
+class FunctionExecutor(_CallableExecutor):
+    """함수 기반 실행기."""
+
+    def __init__(self, func):
+        super().__init__(func)
+        self.func = func
+
+
+class ClassExecutor(_CallableExecutor):
     """클래스 기반 실행기."""
 
     def __init__(self, instance: Any, method_name: str = "invoke"):
         self.instance = instance
         self.method_name = method_name
         self.method = getattr(instance, method_name)
-
-    def invoke(self, query: str, session_id: Optional[str] = None, api_config: Optional[Dict[str, Any]] = None, **kwargs) -> Dict[str, Any]:
-        try:
-            result = self.method(query, **kwargs) if kwargs else self.method(query)
-        except TypeError:
-            result = self.method(query)
-        return self._normalize_result(result)
-
-    async def ainvoke(self, query: str, session_id: Optional[str] = None, api_config: Optional[Dict[str, Any]] = None, **kwargs) -> Dict[str, Any]:
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, lambda: self.invoke(query, session_id, api_config, **kwargs))
-
-    def _normalize_result(self, result: Any) -> Dict[str, Any]:
-        if isinstance(result, dict):
-            content = result.get("response") or result.get("content") or str(result)
-            return {"content": content, "data": result, "is_task_complete": True}
-        return {"content": str(result), "is_task_complete": True}
+        super().__init__(self.method)
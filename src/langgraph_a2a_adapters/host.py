@@ -0,0 +1,142 @@
+"""여러 에이전트를 하나의 ASGI 앱으로 호스팅."""
+
+from __future__ import annotations
+
+from contextlib import AsyncExitStack, asynccontextmanager
+from typing import Any, Dict, Optional, Set
+
+from fastapi import FastAPI
+
+from langgraph_a2a_adapters import server
+from langgraph_a2a_adapters.adapter import LangGraphA2AAdapter
+from langgraph_a2a_adapters.cache import ResourceCache
+from langgraph_a2a_adapters.pool import WorkerPool
+
+
+class A2AHost:
+    """어댑터들을 경로 prefix별로 마운트하는 멀티 에이전트 호스트.
+
+    각 에이전트는 자체 agent card(`/<prefix>/.well-known/agent-card.json`)와 Task 저장소를
+    유지하고, 이벤트 루프 / 스레드 워커 풀 / 리소스 캐시는 함께 사용합니다.
+
+    ```python
+    host = A2AHost(port=8000)
+    host.mount("/weather", weather_adapter)
+    host.mount("/sql", sql_adapter)
+    host.serve()
+    ```
+    """
+
+    def __init__(
+        self,
+        host: str = "0.0.0.0",
+        port: int = 8000,
+        url: Optional[str] = None,
+        worker_pool: Optional[WorkerPool] = None,
+        resources: Optional[ResourceCache] = None,
+        stats_endpoint: bool = False,
+    ):
+        self.host = host
+        self.port = port
+        self.url = url
+        self.worker_pool = worker_pool or WorkerPool()
+        self.resources = resources or ResourceCache()
+        # GET /stats 노출 여부 (인증이 없으므로 기본 꺼짐, 에이전트별 설정과 별개)
+        self.stats_endpoint = stats_endpoint
+        self.adapters: Dict[str, LangGraphA2AAdapter] = {}
+        # agent card url을 호스트 주소로 자동 설정한 prefix (포트가 바뀌면 다시 설정)
+        self._auto_url: Set[str] = set()
+        self._app = None
+
+    def mount(self, prefix: str, adapter: LangGraphA2AAdapter) -> LangGraphA2AAdapter:
+        prefix = "/" + prefix.strip("/")
+        if prefix == "/":
+            raise ValueError("prefix must not be empty")
+        if prefix in self.adapters:
+            raise ValueError(f"prefix {prefix!r} is already mounted")
+        if self._app is not None:
+            raise RuntimeError("cannot mount after the app has been built")
+
+        adapter.use_shared(self.worker_pool, self.resources)
+        self.adapters[prefix] = adapter
+        return adapter
+
+    def get_url(self) -> str:
+        return (self.url or f"http://localhost:{self.port}").rstrip("/")
+
+    def set_port(self, port: int) -> None:
+        if port == self.port:
+            return
+        self.port = port
+        if self._app is not None:
+            self._apply_urls()
+
+    @property
+    def app(self):
+        if self._app is None:
+            self._app = self._create_app()
+        return self._app
+
+    def _create_app(self):
+        app = FastAPI(title="A2A Host", lifespan=self._lifespan)
+        self._auto_url = {prefix for prefix, adapter in self.adapters.items() if adapter.config.url is None}
+        self._apply_urls()
+        for prefix, adapter in self.adapters.items():
+            app.mount(prefix, adapter.app)
+        if self.stats_endpoint:
+            app.add_api_route("/stats", self.stats, methods=["GET"])
+        return app
+
+    def _apply_urls(self) -> None:
+        # agent card의 url이 마운트된 경로를 가리키도록 설정
+        for prefix in self._auto_url:
+            adapter = self.adapters[prefix]
+            url = f"{self.get_url()}{prefix}/"
+            if adapter.config.url != url:
+                adapter.config.url = url
+                adapter.invalidate_agent_card()
+
+    @asynccontextmanager
+    async def _lifespan(self, app):
+        # 마운트된 앱의 lifespan은 실행되지 않으므로 어댑터별 시작 훅/정리를 여기서 실행
+        async with AsyncExitStack() as stack:
+            stack.push_async_callback(self.aclose)
+            for adapter in self.adapters.values():
+                await stack.enter_async_context(adapter._lifespan(adapter.app))
+            yield
+
+    async def aclose(self) -> None:
+        """공유 워커 풀 / 리소스 캐시 정리 (어댑터별 정리는 각 어댑터의 aclose)."""
+        self.resources.clear()
+        self.worker_pool.shutdown(wait=False)
+
+    def prepare_workers(self) -> None:
+        for adapter in self.adapters.values():
+            adapter.prepare_workers()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "worker_pool": self.worker_pool.stats(),
+            "resources": self.resources.stats(),
+            "agents": {prefix: adapter.stats() for prefix, adapter in self.adapters.items()},
+        }
+
+    def serve(
+        self,
+        host: Optional[str] = None,
+        port: Optional[int] = None,
+        workers: int = 1,
+        app_factory: Optional[str] = None,
+        **uvicorn_options: Any,
+    ):
+        """uvicorn으로 서빙 (옵션은 `LangGraphA2AAdapter.serve`와 동일)."""
+        host = host or self.host
+        port = port or self.port
+        self.set_port(port)
+
+        print(f"\nA2A Host ({len(self.adapters)} agents)")
+        for prefix, adapter in self.adapters.items():
+            print(f"  http://{host}:{port}{prefix}/  {adapter.config.name} v{adapter.config.version}")
+        print()
+
+        server.run(self, host, port, workers, app_factory, **uvicorn_options)
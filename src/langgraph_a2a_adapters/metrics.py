@@ -0,0 +1,167 @@
+"""Prometheus 형식 지연 시간 메트릭."""
+
+from __future__ import annotations
+
+import bisect
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from a2a.server.context import ServerCallContext
+from a2a.server.tasks import TaskStore
+from a2a.types import Task
+
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+_HELP = {
+    "a2a_stage_seconds": "Time spent in each request stage",
+    "a2a_node_seconds": "Time spent in each LangGraph node (streaming requests)",
+    "a2a_worker_queue_wait_seconds": "Time spent waiting for a worker pool slot",
+    "a2a_requests_total": "Requests handled, by method and outcome",
+    "a2a_requests_in_flight": "Requests currently executing",
+}
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+class _Histogram:
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+
+
+class Metrics:
+    """히스토그램 / 카운터 / 게이지 레지스트리 (이벤트 루프 스레드에서 사용)."""
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self._histograms: Dict[str, Dict[LabelKey, _Histogram]] = {}
+        self._counters: Dict[str, Dict[LabelKey, float]] = {}
+        self._gauges: Dict[str, Dict[LabelKey, float]] = {}
+
+    def observe(self, name: str, value: float, **labels: str) -> None:
+        series = self._histograms.setdefault(name, {})
+        key = tuple(sorted(labels.items()))
+        histogram = series.get(key)
+        if histogram is None:
+            histogram = series[key] = _Histogram(self.buckets)
+        histogram.counts[bisect.bisect_left(self.buckets, value)] += 1
+        histogram.sum += value
+
+    def inc(self, name: str, value: float = 1.0, **labels: str) -> None:
+        series = self._counters.setdefault(name, {})
+        key = tuple(sorted(labels.items()))
+        series[key] = series.get(key, 0.0) + value
+
+    def add_gauge(self, name: str, value: float, **labels: str) -> None:
+        series = self._gauges.setdefault(name, {})
+        key = tuple(sorted(labels.items()))
+        series[key] = series.get(key, 0.0) + value
+
+    @contextmanager
+    def time(self, name: str, **labels: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - started, **labels)
+
+    def render(self) -> str:
+        """Prometheus text exposition format."""
+        lines: List[str] = []
+        for name, series in self._counters.items():
+            self._header(lines, name, "counter")
+            for key, value in series.items():
+                lines.append(f"{name}{_labels(key)} {_number(value)}")
+        for name, series in self._gauges.items():
+            self._header(lines, name, "gauge")
+            for key, value in series.items():
+                lines.append(f"{name}{_labels(key)} {_number(value)}")
+        for name, series in self._histograms.items():
+            self._header(lines, name, "histogram")
+            for key, histogram in series.items():
+                cumulative = 0
+                for bound, count in zip((*self.buckets, float("inf")), histogram.counts):
+                    cumulative += count
+                    le = "+Inf" if bound == float("inf") else _number(bound)
+                    lines.append(f"{name}_bucket{_labels(key + (('le', le),))} {cumulative}")
+                lines.append(f"{name}_sum{_labels(key)} {_number(histogram.sum)}")
+                lines.append(f"{name}_count{_labels(key)} {cumulative}")
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _header(lines: List[str], name: str, kind: str) -> None:
+        if name in _HELP:
+            lines.append(f"# HELP {name} {_HELP[name]}")
+        lines.append(f"# TYPE {name} {kind}")
+
+
+class InstrumentedTaskStore(TaskStore):
+    """Task 저장소 호출 시간을 `a2a_stage_seconds{stage="task_store_*"}`로 기록."""
+
+    def __init__(self, store: TaskStore, metrics: Metrics):
+        self.store = store
+        self.metrics = metrics
+
+    async def save(self, task: Task, context: ServerCallContext | None = None) -> None:
+        with self.metrics.time("a2a_stage_seconds", stage="task_store_save"):
+            await self.store.save(task, context)
+
+    async def get(self, task_id: str, context: ServerCallContext | None = None) -> Task | None:
+        with self.metrics.time("a2a_stage_seconds", stage="task_store_get"):
+            return await self.store.get(task_id, context)
+
+    async def delete(self, task_id: str, context: ServerCallContext | None = None) -> None:
+        await self.store.delete(task_id, context)
+
+    def __getattr__(self, name: str) -> Any:
+        # close, stats, get_by_context 등은 원래 저장소로 전달
+        return getattr(self.store, name)
+
+
+class TimedEventQueue:
+    """이벤트 발행 시간을 `a2a_stage_seconds{stage="enqueue"}`로 기록하는 EventQueue 래퍼."""
+
+    def __init__(self, queue: Any, metrics: Metrics):
+        self._queue = queue
+        self._metrics = metrics
+
+    async def enqueue_event(self, event: Any) -> None:
+        with self._metrics.time("a2a_stage_seconds", stage="enqueue"):
+            await self._queue.enqueue_event(event)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._queue, name)
+
+
+def _labels(key: LabelKey) -> str:
+    if not key:
+        return ""
+    pairs = ",".join(f'{k}="{_escape(str(v))}"' for k, v in key)
+    return "{" + pairs + "}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _number(value: float) -> str:
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+def optional_time(metrics: Optional[Metrics], name: str, **labels: str):
+    """메트릭이 꺼져 있으면 아무것도 하지 않는 타이머."""
+    if metrics is None:
+        return _NULL_TIMER
+    return metrics.time(name, **labels)
+
+
+class _NullTimer:
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *exc: Any) -> None:
+        return None
+
+
+_NULL_TIMER = _NullTimer()
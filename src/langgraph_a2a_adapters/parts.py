@@ -0,0 +1,188 @@
+"""멀티 파트 입력 (텍스트 / 파일 / 데이터)."""
+
+from __future__ import annotations
+
+import base64
+import io
+import mmap
+import os
+import tempfile
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional
+
+# base64 디코딩 단위 (4의 배수)
+_DECODE_CHUNK = 4 * 256 * 1024
+
+
+@dataclass
+class InputFile:
+    """요청에 첨부된 파일.
+
+    작은 파일은 `content`(bytes)로, `spool_threshold`보다 큰 파일은 임시 파일(`path`)로
+    보관하며 요청이 끝나면 삭제됩니다. URI로 전달된 파일은 내려받지 않고 `uri`만 채웁니다.
+    """
+
+    name: Optional[str] = None
+    mime_type: Optional[str] = None
+    uri: Optional[str] = None
+    content: Optional[bytes] = None
+    path: Optional[str] = None
+    size: int = 0
+
+    @contextmanager
+    def open(self) -> Iterator[BinaryIO]:
+        if self.path is not None:
+            with open(self.path, "rb") as f:
+                yield f
+        elif self.content is not None:
+            yield io.BytesIO(self.content)
+        else:
+            raise ValueError(f"file is only available by uri: {self.uri}")
+
+    @contextmanager
+    def mmap(self) -> Iterator[Any]:
+        """복사 없이 읽는 버퍼 (임시 파일이면 읽기 전용 mmap)."""
+        if self.path is None or self.size == 0:
+            with self.open() as f:
+                yield memoryview(f.read())
+            return
+        with open(self.path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            yield buffer
+
+    def read_bytes(self) -> bytes:
+        with self.open() as f:
+            return f.read()
+
+
+@dataclass
+class RequestInput:
+    """요청 메시지의 파트: 텍스트 파트는 줄바꿈으로 합치고 파일 / 데이터 파트는 순서대로 보관."""
+
+    text: str = ""
+    files: List[InputFile] = field(default_factory=list)
+    data: List[Dict[str, Any]] = field(default_factory=list)
+
+    def cleanup(self) -> None:
+        for file in self.files:
+            if file.path is not None:
+                try:
+                    os.unlink(file.path)
+                except FileNotFoundError:
+                    pass
+                file.path = None
+
+
+_current_input: ContextVar[Optional[RequestInput]] = ContextVar("a2a_request_input", default=None)
+
+
+def current_input() -> Optional[RequestInput]:
+    """현재 요청의 파일 / 데이터 파트 (에이전트 함수나 그래프 노드에서 호출).
+
+    `is_cancelled()`와 마찬가지로 스레드에서도 보이지만 프로세스 풀 모드에서는 None입니다.
+    """
+    return _current_input.get()
+
+
+@contextmanager
+def bind_input(request_input: RequestInput) -> Iterator[RequestInput]:
+    """요청 처리 동안 `current_input()`으로 노출하고, 끝나면 임시 파일 삭제."""
+    token = _current_input.set(request_input)
+    try:
+        yield request_input
+    finally:
+        _current_input.reset(token)
+        request_input.cleanup()
+
+
+def has_file_parts(message: Any) -> bool:
+    return any(getattr(getattr(part, "root", part), "kind", None) == "file" for part in _parts(message))
+
+
+def extract_input(message: Any, spool_threshold: int) -> RequestInput:
+    """메시지 파트를 `RequestInput`으로 변환 (큰 파일은 디스크에 쓰므로 스레드에서 호출).
+
+    임시 파일로 옮긴 파일 파트는 Task 기록 / 저장소에 base64 원본이 남지 않도록 메시지에서
+    bytes를 비우고 `metadata`에 크기만 남깁니다.
+    """
+    request_input = RequestInput()
+    texts = []
+    try:
+        for part in _parts(message):
+            inner = getattr(part, "root", part)
+            if isinstance(inner, dict):
+                kind = inner.get("kind")
+                if kind == "text":
+                    texts.append(inner.get("text", ""))
+                elif kind == "data":
+                    request_input.data.append(inner.get("data") or {})
+                continue
+
+            kind = getattr(inner, "kind", None)
+            if kind == "file":
+                input_file = _input_file(inner.file, spool_threshold)
+                request_input.files.append(input_file)
+                if input_file.path is not None:
+                    _omit_bytes(inner, input_file)
+            elif kind == "data":
+                request_input.data.append(inner.data)
+            elif hasattr(inner, "text"):
+                texts.append(inner.text)
+    except BaseException:
+        request_input.cleanup()
+        raise
+    request_input.text = "\n".join(texts)
+    return request_input
+
+
+def _parts(message: Any) -> List[Any]:
+    return (getattr(message, "parts", None) or []) if message is not None else []
+
+
+def _input_file(file: Any, spool_threshold: int) -> InputFile:
+    name = getattr(file, "name", None)
+    mime_type = getattr(file, "mime_type", None)
+    uri = getattr(file, "uri", None)
+    if uri is not None:
+        return InputFile(name=name, mime_type=mime_type, uri=uri)
+
+    encoded = file.bytes
+    if len(encoded) // 4 * 3 <= spool_threshold:
+        # 공백(MIME 줄바꿈, 탭 등)만 지우고 나머지 base64가 아닌 문자는 binascii.Error
+        content = base64.b64decode("".join(encoded.split()), validate=True)
+        return InputFile(name=name, mime_type=mime_type, content=content, size=len(content))
+
+    # 디코딩한 전체 bytes를 메모리에 만들지 않고 조각씩 임시 파일에 기록
+    fd, path = tempfile.mkstemp(prefix="a2a-input-")
+    size = 0
+    try:
+        with os.fdopen(fd, "wb") as f:
+            for chunk in _decode_chunks(encoded):
+                f.write(chunk)
+                size += len(chunk)
+    except BaseException:
+        os.unlink(path)
+        raise
+    return InputFile(name=name, mime_type=mime_type, path=path, size=size)
+
+
+def _decode_chunks(encoded: str) -> Iterator[bytes]:
+    # MIME 스타일 줄바꿈이 있어도 조각마다 공백을 지우고 4문자 경계에서 나눔 (전체 복사 없음)
+    # validate=True: base64가 아닌 문자를 조용히 버리지 않고 binascii.Error
+    carry = ""
+    for start in range(0, len(encoded), _DECODE_CHUNK):
+        chunk = carry + "".join(encoded[start:start + _DECODE_CHUNK].split())
+        usable = len(chunk) // 4 * 4
+        carry = chunk[usable:]
+        if usable:
+            yield base64.b64decode(chunk[:usable], validate=True)
+    if carry:
+        # 남은 문자가 4의 배수가 아니면 잘못된 base64 (binascii.Error)
+        yield base64.b64decode(carry, validate=True)
+
+
+def _omit_bytes(part: Any, input_file: InputFile) -> None:
+    # 원본 base64 문자열 대신 크기만 남김 (내용은 요청 처리 동안 `current_input()`으로 제공)
+    part.file.bytes = ""
+    part.metadata = {**(part.metadata or {}), "bytes_omitted": True, "size": input_file.size}
\ No newline at end of file
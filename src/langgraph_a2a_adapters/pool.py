@@ -0,0 +1,232 @@
+"""동기 실행용 워커 풀."""
+
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import os
+import pickle
+import time
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Dict, List, Optional, Set, Tuple
+
+if TYPE_CHECKING:
+    from langgraph_a2a_adapters.metrics import Metrics
+
+
+class WorkerPoolFullError(RuntimeError):
+    """워커 풀 대기열이 가득 찼거나 대기 시간이 초과됨 (재시도 가능)."""
+
+
+class WorkerPool:
+    """크기와 대기열 길이가 제한된 전용 스레드 풀.
+
+    실행 슬롯이 모두 사용 중이면 최대 `max_queue`개 요청까지 `queue_timeout`초 동안
+    대기하고, 그 이상은 즉시 `WorkerPoolFullError`로 거절합니다.
+    """
+
+    # 작업이 같은 메모리 공간에서 실행되는지 (False면 인자/결과가 pickle로 전달됨)
+    shares_memory = True
+    # 어댑터가 메트릭을 켜면 대기 시간을 기록 (a2a_worker_queue_wait_seconds)
+    metrics: Optional[Metrics] = None
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        max_queue: int = 100,
+        queue_timeout: Optional[float] = 30.0,
+    ):
+        self.max_workers = max_workers or min(32, (os.cpu_count() or 1) + 4)
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self._executor: Optional[Executor] = None
+        self._slots = asyncio.Semaphore(self.max_workers)
+        self._active = 0
+        self._queued = 0
+        self._completed = 0
+        self._rejected = 0
+        self._detached = 0
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[Executor]:
+        """실행 슬롯을 확보하고 작업을 제출할 executor를 반환."""
+        if self._slots.locked() and self._queued >= self.max_queue:
+            self._rejected += 1
+            raise WorkerPoolFullError(
+                f"worker pool is full ({self.max_workers} running, {self._queued} queued)"
+            )
+
+        self._queued += 1
+        started = time.perf_counter()
+        try:
+            await asyncio.wait_for(self._slots.acquire(), self.queue_timeout)
+        except asyncio.TimeoutError:
+            self._rejected += 1
+            raise WorkerPoolFullError(
+                f"timed out after {self.queue_timeout}s waiting for a worker"
+            ) from None
+        finally:
+            self._queued -= 1
+        if self.metrics is not None:
+            self.metrics.observe("a2a_worker_queue_wait_seconds", time.perf_counter() - started)
+
+        self._active += 1
+        lease = _SlotExecutor(self.executor)
+        try:
+            yield lease
+        finally:
+            running = [future for future in lease.pending if not future.done()]
+            if running:
+                # 취소되어도 스레드/프로세스의 작업은 계속 실행되므로 실제로 끝날 때 슬롯 반환
+                self._release_when_done(running, asyncio.get_running_loop())
+            else:
+                self._release()
+
+    def _release(self) -> None:
+        self._active -= 1
+        self._completed += 1
+        self._slots.release()
+
+    def _release_when_done(self, futures: List[Future], loop: asyncio.AbstractEventLoop) -> None:
+        self._detached += 1
+        remaining = [len(futures)]
+
+        def done(_: Future) -> None:
+            remaining[0] -= 1
+            if remaining[0] == 0:
+                try:
+                    loop.call_soon_threadsafe(self._release_detached)
+                except RuntimeError:
+                    # 이벤트 루프가 이미 닫힘 (종료 중)
+                    pass
+
+        for future in futures:
+            future.add_done_callback(done)
+
+    def _release_detached(self) -> None:
+        self._detached -= 1
+        self._release()
+
+    @property
+    def executor(self) -> Executor:
+        if self._executor is None:
+            self._executor = self._create_executor()
+        return self._executor
+
+    def _create_executor(self) -> Executor:
+        return ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="a2a-worker")
+
+    async def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        async with self.slot() as executor:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(executor, func, *args)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "max_workers": self.max_workers,
+            "max_queue": self.max_queue,
+            "active": self._active,
+            "queued": self._queued,
+            "completed": self._completed,
+            "rejected": self._rejected,
+            # 요청은 끝났지만(취소 등) 작업이 아직 실행 중이라 반환되지 않은 슬롯
+            "detached": self._detached,
+            "utilization": self._active / self.max_workers,
+        }
+
+    def warmup(self) -> None:
+        """워커를 미리 띄워 첫 요청의 기동 지연을 없앰."""
+        for _ in range(self.max_workers):
+            self.executor.submit(_noop)
+
+    def shutdown(self, wait: bool = True) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+
+
+class ProcessWorkerPool(WorkerPool):
+    """CPU 바운드 함수용 프로세스 풀.
+
+    GIL 없이 노드의 모든 코어를 사용합니다. 함수와 인자/결과는 pickle 가능해야 하며,
+    워커 프로세스가 죽으면 풀을 다시 만들고 해당 요청만 실패시킵니다.
+    """
+
+    shares_memory = False
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        max_queue: int = 100,
+        queue_timeout: Optional[float] = 30.0,
+        initializer: Optional[Callable[..., Any]] = None,
+        initargs: Tuple[Any, ...] = (),
+        start_method: str = "spawn",
+    ):
+        super().__init__(max_workers or os.cpu_count() or 1, max_queue, queue_timeout)
+        self.initializer = initializer
+        self.initargs = initargs
+        self.start_method = start_method
+        self._crashes = 0
+
+    def _create_executor(self) -> Executor:
+        return ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=multiprocessing.get_context(self.start_method),
+            initializer=self.initializer,
+            initargs=self.initargs,
+        )
+
+    async def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        async with self.slot() as executor:
+            loop = asyncio.get_running_loop()
+            try:
+                return await loop.run_in_executor(executor, func, *args)
+            except BrokenProcessPool:
+                self._restart(executor)
+                raise RuntimeError("worker process crashed; process pool restarted") from None
+
+    def _restart(self, broken: Executor) -> None:
+        # 동시에 실패한 요청들이 풀을 여러 번 재생성하지 않도록 같은 풀일 때만 교체
+        if isinstance(broken, _SlotExecutor):
+            broken = broken.inner
+        if self._executor is not broken:
+            return
+        self._crashes += 1
+        broken.shutdown(wait=False, cancel_futures=True)
+        self._executor = None
+        self.warmup()
+
+    def stats(self) -> Dict[str, Any]:
+        return {**super().stats(), "mode": "process", "crashes": self._crashes}
+
+
+class _SlotExecutor(Executor):
+    """슬롯 하나에서 제출된 작업을 추적하는 executor 래퍼."""
+
+    def __init__(self, inner: Executor):
+        self.inner = inner
+        self.pending: Set[Future] = set()
+
+    def submit(self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Future:
+        future = self.inner.submit(fn, *args, **kwargs)
+        self.pending.add(future)
+        future.add_done_callback(self.pending.discard)
+        return future
+
+
+def ensure_picklable(obj: Any, name: str = "callable") -> None:
+    """프로세스 풀로 보낼 수 있는지 확인."""
+    try:
+        pickle.dumps(obj)
+    except Exception as e:
+        raise ValueError(
+            f"{name} {obj!r} cannot be pickled for a process pool; "
+            "use a module-level function and picklable initializer arguments"
+        ) from e
+
+
+def _noop() -> None:
+    return None
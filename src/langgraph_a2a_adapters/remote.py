@@ -0,0 +1,334 @@
+"""원격 A2A 에이전트 호출."""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import json
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, AsyncIterator, Dict, List, Optional, Set, Tuple
+
+import httpx
+
+from langgraph_a2a_adapters import tracing
+from langgraph_a2a_adapters.executor import BaseExecutor
+
+# agent card 경로 (구버전 SDK는 agent.json)
+AGENT_CARD_PATHS = ("/.well-known/agent-card.json", "/.well-known/agent.json")
+FAILED_STATES = {"failed", "rejected", "canceled"}
+
+# url -> (agent card, 만료 시각), 모든 RemoteA2AExecutor가 공유 (저장 순서, 최대 _MAX_AGENT_CARDS개)
+_agent_cards: OrderedDict[str, Tuple[Dict[str, Any], float]] = OrderedDict()
+_MAX_AGENT_CARDS = 256
+
+
+class RemoteAgentError(RuntimeError):
+    """원격 에이전트가 오류를 반환하거나 Task가 실패함."""
+
+    def __init__(self, message: str, state: Optional[str] = None):
+        super().__init__(message)
+        self.state = state
+
+
+class RemoteA2AExecutor(BaseExecutor):
+    """원격 A2A 에이전트를 호출하는 실행기.
+
+    keep-alive 커넥션 풀(h2가 설치되어 있으면 HTTP/2)을 재사용하고, agent card를
+    `card_ttl`초 동안 캐시합니다. 원격 에이전트가 스트리밍을 지원하면 `astream`은
+    `message/stream` SSE를 도착하는 대로 청크로 전달합니다.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        timeout: float = 120.0,
+        connect_timeout: float = 5.0,
+        headers: Optional[Dict[str, str]] = None,
+        forward_api_config: bool = False,
+        card_ttl: float = 300.0,
+        http2: Optional[bool] = None,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        client: Optional[httpx.AsyncClient] = None,
+    ):
+        self.url = url.rstrip("/")
+        self.timeout = httpx.Timeout(timeout, connect=connect_timeout)
+        self.headers = headers or {}
+        # True면 api_config를 다시 X- 헤더로 전달 (OPENAI_API_KEY -> X-OPENAI-API-KEY)
+        self.forward_api_config = forward_api_config
+        self.card_ttl = card_ttl
+        self.http2 = importlib.util.find_spec("h2") is not None if http2 is None else http2
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+        )
+        self._client = client
+        self._owns_client = client is None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._sync_client: Optional[httpx.Client] = None
+        self._lock = threading.Lock()
+        # 루프가 바뀌어 교체된 클라이언트를 닫는 Task (GC 방지용 참조)
+        self._closing: Set[asyncio.Task] = set()
+
+    def _get_client(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        # 커넥션은 이벤트 루프에 묶이므로 루프가 바뀌면(asyncio.run 반복 등) 새로 생성
+        if self._owns_client and (self._client is None or self._client_loop is not loop):
+            previous, previous_loop = self._client, self._client_loop
+            self._client = httpx.AsyncClient(timeout=self.timeout, limits=self.limits, http2=self.http2)
+            self._client_loop = loop
+            if previous is not None:
+                self._close_replaced(previous, previous_loop)
+        return self._client
+
+    def _close_replaced(self, client: httpx.AsyncClient, loop: Optional[asyncio.AbstractEventLoop]) -> None:
+        # 이전 루프가 아직 돌고 있으면 그 루프에서, 이미 닫혔으면 현재 루프에서 커넥션 정리
+        if loop is not None and loop.is_running():
+            asyncio.run_coroutine_threadsafe(_aclose_quietly(client), loop)
+            return
+        task = asyncio.get_running_loop().create_task(_aclose_quietly(client))
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    def _get_sync_client(self) -> httpx.Client:
+        with self._lock:
+            if self._sync_client is None:
+                self._sync_client = httpx.Client(timeout=self.timeout, limits=self.limits, http2=self.http2)
+            return self._sync_client
+
+    async def get_agent_card(self) -> Dict[str, Any]:
+        cached = _agent_cards.get(self.url)
+        if cached is not None and cached[1] > time.monotonic():
+            return cached[0]
+        client = self._get_client()
+        for path in AGENT_CARD_PATHS:
+            response = await client.get(self.url + path, headers=self.headers)
+            if response.status_code != 404:
+                break
+        response.raise_for_status()
+        return self._store_card(response.json())
+
+    def get_agent_card_sync(self) -> Dict[str, Any]:
+        cached = _agent_cards.get(self.url)
+        if cached is not None and cached[1] > time.monotonic():
+            return cached[0]
+        client = self._get_sync_client()
+        for path in AGENT_CARD_PATHS:
+            response = client.get(self.url + path, headers=self.headers)
+            if response.status_code != 404:
+                break
+        response.raise_for_status()
+        return self._store_card(response.json())
+
+    def _store_card(self, card: Dict[str, Any]) -> Dict[str, Any]:
+        now = time.monotonic()
+        _agent_cards.pop(self.url, None)
+        _agent_cards[self.url] = (card, now + self.card_ttl)
+        # 만료된 카드와 한도를 넘은 오래된 카드 제거
+        for url, (_, expires_at) in list(_agent_cards.items()):
+            if expires_at <= now or len(_agent_cards) > _MAX_AGENT_CARDS:
+                _agent_cards.pop(url, None)
+        return card
+
+    def _request(
+        self, method: str, query: str, session_id: Optional[str], api_config: Optional[Dict[str, Any]]
+    ) -> Tuple[Dict[str, Any], Dict[str, str]]:
+        body = {
+            "jsonrpc": "2.0",
+            "id": str(uuid.uuid4()),
+            "method": method,
+            "params": {
+                "message": {
+                    "role": "user",
+                    "messageId": str(uuid.uuid4()),
+                    "parts": [{"kind": "text", "text": query}],
+                }
+            },
+        }
+        if session_id:
+            # 원격 에이전트가 같은 contextId(thread_id)로 대화 상태를 이어가도록 전달
+            body["params"]["message"]["contextId"] = session_id
+        headers = dict(self.headers)
+        if self.forward_api_config and api_config:
+            for key, value in api_config.items():
+                if isinstance(value, str):
+                    headers["X-" + key.replace("_", "-")] = value
+        return body, headers
+
+    def _span(self, method: str, headers: Dict[str, str]):
+        # traceparent 헤더로 원격 에이전트의 span이 이 호출의 자식이 됨
+        return tracing.client_span(f"a2a.remote {method}", headers, {"a2a.method": method, "server.address": self.url})
+
+    def invoke(self, query: str, session_id: Optional[str] = None, api_config: Optional[Dict[str, Any]] = None, **kwargs) -> Dict[str, Any]:
+        body, headers = self._request("message/send", query, session_id, api_config)
+        with self._span("message/send", headers):
+            response = self._get_sync_client().post(self.url + "/", json=body, headers=headers)
+            return _send_response(response)
+
+    async def ainvoke(self, query: str, session_id: Optional[str] = None, api_config: Optional[Dict[str, Any]] = None, **kwargs) -> Dict[str, Any]:
+        body, headers = self._request("message/send", query, session_id, api_config)
+        with self._span("message/send", headers):
+            response = await self._get_client().post(self.url + "/", json=body, headers=headers)
+            return _send_response(response)
+
+    async def astream(self, query: str, session_id: Optional[str] = None, api_config: Optional[Dict[str, Any]] = None, **kwargs) -> AsyncIterator[Dict[str, Any]]:
+        card = await self.get_agent_card()
+        if not (card.get("capabilities") or {}).get("streaming"):
+            async for chunk in super().astream(query, session_id, api_config, **kwargs):
+                yield chunk
+            return
+
+        body, headers = self._request("message/stream", query, session_id, api_config)
+        headers["Accept"] = "text/event-stream"
+        # artifact id -> 이어 붙인 텍스트
+        artifacts: Dict[str, List[str]] = {}
+        final_text = None
+
+        with self._span("message/stream", headers):
+            async with self._get_client().stream("POST", self.url + "/", json=body, headers=headers) as response:
+                response.raise_for_status()
+                async for data in _iter_sse(response):
+                    result = _jsonrpc_result(data)
+                    kind = result.get("kind")
+
+                    if kind == "artifact-update":
+                        artifact = result.get("artifact") or {}
+                        text = _parts_text(artifact.get("parts"))
+                        if not text:
+                            continue
+                        artifacts.setdefault(artifact.get("artifactId", ""), []).append(text)
+                        yield {
+                            "is_task_complete": False,
+                            "require_user_input": False,
+                            "content": text,
+                            "node": artifact.get("name") or "response",
+                            "delta": True,
+                        }
+                        continue
+
+                    state, text = _result_state(result)
+                    if state in FAILED_STATES:
+                        raise RemoteAgentError(text or f"remote task {state}", state)
+                    if kind == "message" or state == "completed":
+                        final_text = text
+                        break
+                    if text:
+                        message = (result.get("status") or {}).get("message") or {}
+                        yield {
+                            "is_task_complete": False,
+                            "require_user_input": False,
+                            "content": text,
+                            "node": (message.get("metadata") or {}).get("node") or "remote",
+                        }
+
+        if not final_text:
+            final_text = "".join("".join(pieces) for pieces in artifacts.values())
+        yield {"is_task_complete": True, "require_user_input": False, "content": final_text}
+
+    async def aclose(self) -> None:
+        if self._owns_client and self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        if self._sync_client is not None:
+            self._sync_client.close()
+            self._sync_client = None
+
+
+async def _aclose_quietly(client: httpx.AsyncClient) -> None:
+    try:
+        await client.aclose()
+    except Exception:
+        pass
+
+
+def remote_agent_tool(
+    url: str,
+    name: Optional[str] = None,
+    description: Optional[str] = None,
+    **executor_kwargs: Any,
+):
+    """원격 A2A 에이전트를 LangChain 도구로 변환.
+
+    name/description을 생략하면 agent card에서 가져옵니다. 호출 실패는 예외 대신 오류
+    메시지로 반환해 에이전트가 계속 진행할 수 있게 합니다.
+    """
+    from langchain_core.tools import StructuredTool
+
+    executor = RemoteA2AExecutor(url, **executor_kwargs)
+    if name is None or description is None:
+        card = executor.get_agent_card_sync()
+        name = name or _tool_name(card.get("name") or "remote_agent")
+        description = description or card.get("description") or f"{card.get('name')} A2A agent"
+
+    def call(query: str) -> str:
+        try:
+            return executor.invoke(query)["content"]
+        except Exception as e:
+            return f"{name} failed: {e}"
+
+    async def acall(query: str) -> str:
+        try:
+            return (await executor.ainvoke(query))["content"]
+        except Exception as e:
+            return f"{name} failed: {e}"
+
+    tool = StructuredTool.from_function(func=call, coroutine=acall, name=name, description=description)
+    tool.metadata = {"a2a_url": executor.url}
+    return tool
+
+
+def _tool_name(name: str) -> str:
+    return "".join(c if c.isalnum() else "_" for c in name.lower()).strip("_") or "remote_agent"
+
+
+async def _iter_sse(response: httpx.Response) -> AsyncIterator[Dict[str, Any]]:
+    """SSE 이벤트의 data를 도착하는 대로 JSON으로 반환."""
+    data: List[str] = []
+    async for line in response.aiter_lines():
+        if line.startswith("data:"):
+            data.append(line[5:].lstrip())
+        elif not line and data:
+            yield json.loads("\n".join(data))
+            data = []
+    if data:
+        yield json.loads("\n".join(data))
+
+
+def _jsonrpc_result(data: Dict[str, Any]) -> Dict[str, Any]:
+    if "error" in data:
+        error = data["error"] or {}
+        raise RemoteAgentError(error.get("message") or str(error))
+    return data.get("result") or {}
+
+
+def _send_response(response: httpx.Response) -> Dict[str, Any]:
+    response.raise_for_status()
+    result = _jsonrpc_result(response.json())
+    state, text = _result_state(result)
+    if state in FAILED_STATES:
+        raise RemoteAgentError(text or f"remote task {state}", state)
+    return {"content": text, "data": result, "is_task_complete": True}
+
+
+def _result_state(result: Dict[str, Any]) -> Tuple[Optional[str], str]:
+    """Task / Message / status-update 결과의 (상태, 응답 텍스트)."""
+    if result.get("kind") == "message":
+        return None, _parts_text(result.get("parts"))
+
+    status = result.get("status") or {}
+    state = status.get("state")
+    message = status.get("message")
+    if message:
+        return state, _parts_text(message.get("parts"))
+    for message in reversed(result.get("history") or []):
+        if message.get("role") == "agent":
+            return state, _parts_text(message.get("parts"))
+    artifacts = result.get("artifacts") or []
+    return state, "".join(_parts_text(artifact.get("parts")) for artifact in artifacts)
+
+
+def _parts_text(parts: Optional[List[Dict[str, Any]]]) -> str:
+    return "".join(part.get("text", "") for part in parts or [] if part.get("kind") == "text")
@@ -0,0 +1,196 @@
+"""결정적 에이전트용 응답 캐시."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import sqlite3
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+
+def request_key(text: str, *parts: Any) -> str:
+    """공백을 정규화한 입력 텍스트와 나머지 구성 요소의 해시 키."""
+    payload = json.dumps([" ".join(text.split()), *parts], ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class MemoryCacheBackend:
+    """개수/용량이 제한된 인메모리 LRU 백엔드."""
+
+    def __init__(self, max_entries: Optional[int] = 1000, max_bytes: Optional[int] = 64 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        # key -> (값, 만료 시각, 크기)
+        self._entries: OrderedDict[str, Tuple[str, float, int]] = OrderedDict()
+        self._bytes = 0
+        self._evictions = 0
+
+    async def get(self, key: str) -> Optional[str]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[1] < time.time():
+            self._pop(key)
+            return None
+        self._entries.move_to_end(key)
+        return entry[0]
+
+    async def set(self, key: str, value: str, ttl: float) -> None:
+        if key in self._entries:
+            self._pop(key)
+        self._entries[key] = (value, time.time() + ttl, len(value))
+        self._bytes += len(value)
+        while self._entries and (
+            (self.max_entries is not None and len(self._entries) > self.max_entries)
+            or (self.max_bytes is not None and self._bytes > self.max_bytes)
+        ):
+            self._pop(next(iter(self._entries)))
+            self._evictions += 1
+
+    async def close(self) -> None:
+        self._entries.clear()
+        self._bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        return {"entries": len(self._entries), "bytes": self._bytes, "evictions": self._evictions}
+
+    def _pop(self, key: str) -> None:
+        self._bytes -= self._entries.pop(key)[2]
+
+
+class DiskCacheBackend:
+    """SQLite 파일 백엔드 (프로세스 재시작/여러 워커 간 공유)."""
+
+    def __init__(self, path: str, max_entries: Optional[int] = 100_000):
+        self.path = path
+        self.max_entries = max_entries
+        self._db_thread = ThreadPoolExecutor(max_workers=1, thread_name_prefix="a2a-response-cache")
+        self._conn: Optional[sqlite3.Connection] = None
+        self._evictions = 0
+        self._db_thread.submit(self._connect).result()
+
+    def _connect(self) -> None:
+        conn = sqlite3.connect(self.path, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                expires_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+            """
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_accessed_at ON responses (accessed_at)")
+        conn.commit()
+        self._conn = conn
+
+    async def _run(self, func, *args) -> Any:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._db_thread, func, *args)
+
+    async def get(self, key: str) -> Optional[str]:
+        return await self._run(self._get, key)
+
+    async def set(self, key: str, value: str, ttl: float) -> None:
+        await self._run(self._set, key, value, ttl)
+
+    async def close(self) -> None:
+        await self._run(self._conn.close)
+        self._db_thread.shutdown(wait=True)
+
+    def stats(self) -> Dict[str, Any]:
+        return {"backend": "sqlite", "evictions": self._evictions}
+
+    def _get(self, key: str) -> Optional[str]:
+        now = time.time()
+        row = self._conn.execute(
+            "SELECT value FROM responses WHERE key = ? AND expires_at >= ?", (key, now)
+        ).fetchone()
+        if row is None:
+            return None
+        with self._conn:
+            self._conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+        return row[0]
+
+    def _set(self, key: str, value: str, ttl: float) -> None:
+        now = time.time()
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, value, expires_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, value, now + ttl, now),
+            )
+            self._conn.execute("DELETE FROM responses WHERE expires_at < ?", (now,))
+            if self.max_entries is not None:
+                # 가장 오래 사용되지 않은 항목부터 제거
+                cursor = self._conn.execute(
+                    """
+                    DELETE FROM responses WHERE key IN (
+                        SELECT key FROM responses ORDER BY accessed_at DESC LIMIT -1 OFFSET ?
+                    )
+                    """,
+                    (self.max_entries,),
+                )
+                self._evictions += cursor.rowcount
+
+
+class ResponseCache:
+    """입력 텍스트, 스킬 id, api_config(X- 헤더)로 응답을 캐시.
+
+    캐시 적중 시 그래프와 LLM 호출을 건너뜁니다. 같은 입력에 같은 응답을 돌려주는
+    결정적 에이전트에만 사용하세요. `key_config_keys`를 지정하지 않으면 모든
+    api_config 항목이 키에 포함되어 테넌트끼리 캐시를 공유하지 않습니다.
+    """
+
+    def __init__(
+        self,
+        backend: Any = None,
+        ttl: float = 300.0,
+        key_config_keys: Optional[Iterable[str]] = None,
+    ):
+        self.backend = backend if backend is not None else MemoryCacheBackend()
+        self.ttl = ttl
+        self.key_config_keys = tuple(key_config_keys) if key_config_keys is not None else None
+        self._hits = 0
+        self._misses = 0
+        self._bypasses = 0
+
+    def make_key(self, text: str, skill_id: str = "", api_config: Optional[Dict[str, Any]] = None) -> str:
+        api_config = api_config or {}
+        if self.key_config_keys is None:
+            return request_key(text, skill_id, sorted(api_config.items()))
+        return request_key(text, skill_id, [[key, api_config.get(key)] for key in self.key_config_keys])
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        value = await self.backend.get(key)
+        if value is None:
+            self._misses += 1
+            return None
+        self._hits += 1
+        return {"content": json.loads(value), "is_task_complete": True}
+
+    async def set(self, key: str, result: Dict[str, Any]) -> None:
+        # 전체 그래프 상태(data)는 보관하지 않고 응답 텍스트만 저장
+        await self.backend.set(key, json.dumps(result.get("content", ""), ensure_ascii=False), self.ttl)
+
+    def record_bypass(self) -> None:
+        self._bypasses += 1
+
+    async def close(self) -> None:
+        await self.backend.close()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self._hits + self._misses
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "bypasses": self._bypasses,
+            "hit_ratio": self._hits / lookups if lookups else 0.0,
+            **self.backend.stats(),
+        }
@@ -0,0 +1,255 @@
+"""여러 원격 에이전트로 요청을 분산하는 라우터."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from typing import Any, AsyncIterator, Deque, Dict, List, Optional, Union
+
+from langgraph_a2a_adapters.executor import BaseExecutor
+from langgraph_a2a_adapters.remote import RemoteA2AExecutor
+
+STRATEGIES = ("balance", "first", "all")
+# 연속 실패 시 순위에서 뒤로 보내는 최대 시간 (초)
+MAX_COOLDOWN = 30.0
+
+
+class _Backend:
+    """백엔드별 진행 중 요청 수, 최근 응답 시간(message/send만), 연속 실패."""
+
+    def __init__(self, name: str, executor: BaseExecutor, window: int):
+        self.name = name
+        self.executor = executor
+        self.outstanding = 0
+        self.successes = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+        self.cooldown_until = 0.0
+        self.latencies: Deque[float] = deque(maxlen=window)
+
+    def record_success(self, latency: Optional[float] = None) -> None:
+        self.successes += 1
+        self.consecutive_failures = 0
+        self.cooldown_until = 0.0
+        if latency is not None:
+            self.latencies.append(latency)
+
+    def record_failure(self, cooldown: float) -> None:
+        self.failures += 1
+        self.consecutive_failures += 1
+        if cooldown > 0:
+            delay = min(cooldown * 2 ** (self.consecutive_failures - 1), MAX_COOLDOWN)
+            self.cooldown_until = time.monotonic() + delay
+
+    def cooling_down(self, now: float) -> bool:
+        return self.cooldown_until > now
+
+    def percentile(self, p: float) -> Optional[float]:
+        if not self.latencies:
+            return None
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, int(p * len(ordered)))]
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "outstanding": self.outstanding,
+            "successes": self.successes,
+            "failures": self.failures,
+            "consecutive_failures": self.consecutive_failures,
+            "p50": self.percentile(0.5),
+            "p95": self.percentile(0.95),
+            "p99": self.percentile(0.99),
+        }
+
+
+class RouterExecutor(BaseExecutor):
+    """여러 백엔드(원격 A2A URL 또는 실행기) 중 하나 이상으로 요청을 라우팅.
+
+    - `balance`: 진행 중 요청이 가장 적은(동률이면 p50이 낮은, 그래도 같으면 돌아가며)
+      백엔드로 전송하고, `hedge_percentile` 응답 시간 안에 답이 없으면 다음 백엔드로
+      중복 요청(hedge)
+    - `first`: 모든 백엔드에 동시에 보내고 처음 성공한 응답 사용
+    - `all`: 모든 백엔드의 성공한 응답을 `separator`로 합침
+
+    실패한 백엔드는 건너뛰고 다음 백엔드로 재시도하며, 모두 실패하면 마지막 예외를
+    전달합니다. 실패한 백엔드는 `failure_cooldown`초(연속 실패마다 두 배, 최대 30초) 동안
+    순위의 맨 뒤로 보냅니다.
+    """
+
+    def __init__(
+        self,
+        backends: List[Union[str, BaseExecutor]],
+        strategy: str = "balance",
+        hedge_percentile: Optional[float] = 0.95,
+        hedge_min_samples: int = 20,
+        max_hedges: int = 1,
+        latency_window: int = 256,
+        separator: str = "\n\n",
+        failure_cooldown: float = 1.0,
+        **remote_options: Any,
+    ):
+        if not backends:
+            raise ValueError("at least one backend is required")
+        if strategy not in STRATEGIES:
+            raise ValueError(f"unknown strategy: {strategy!r} (expected one of {STRATEGIES})")
+        self.backends = [
+            _Backend(
+                backend if isinstance(backend, str) else f"{type(backend).__name__}-{i}",
+                RemoteA2AExecutor(backend, **remote_options) if isinstance(backend, str) else backend,
+                latency_window,
+            )
+            for i, backend in enumerate(backends)
+        ]
+        self.strategy = strategy
+        self.hedge_percentile = hedge_percentile
+        # 응답 시간 표본이 이보다 적으면 hedge하지 않음
+        self.hedge_min_samples = hedge_min_samples
+        self.max_hedges = max_hedges
+        self.separator = separator
+        self.failure_cooldown = failure_cooldown
+        self._hedges = 0
+        # 순위가 같은 백엔드 사이의 round-robin 시작 위치
+        self._rotation = 0
+
+    def invoke(self, query: str, session_id: Optional[str] = None, api_config: Optional[Dict[str, Any]] = None, **kwargs) -> Dict[str, Any]:
+        return asyncio.run(self.ainvoke(query, session_id, api_config, **kwargs))
+
+    async def ainvoke(self, query: str, session_id: Optional[str] = None, api_config: Optional[Dict[str, Any]] = None, **kwargs) -> Dict[str, Any]:
+        args = (query, session_id, api_config, kwargs)
+        if self.strategy == "all":
+            return await self._gather(*args)
+        if self.strategy == "first":
+            return await self._race(self.backends, len(self.backends), *args)
+        return await self._race(self._ranked(), 1, *args)
+
+    async def astream(self, query: str, session_id: Optional[str] = None, api_config: Optional[Dict[str, Any]] = None, **kwargs) -> AsyncIterator[Dict[str, Any]]:
+        if self.strategy != "balance":
+            async for chunk in super().astream(query, session_id, api_config, **kwargs):
+                yield chunk
+            return
+
+        # 첫 청크를 받기 전에 실패하면 다음 백엔드로 넘어감 (스트리밍은 hedge하지 않음)
+        # 스트림 전체 시간은 응답 길이에 좌우되므로 hedge 기준 응답 시간에 넣지 않음
+        error: Optional[BaseException] = None
+        for backend in self._ranked():
+            received = False
+            backend.outstanding += 1
+            try:
+                async for chunk in backend.executor.astream(query, session_id, api_config, **kwargs):
+                    received = True
+                    yield chunk
+                backend.record_success()
+                return
+            except Exception as e:
+                backend.record_failure(self.failure_cooldown)
+                if received:
+                    raise
+                error = e
+            finally:
+                backend.outstanding -= 1
+        raise error
+
+    def _ranked(self) -> List[_Backend]:
+        now = time.monotonic()
+        start = self._rotation % len(self.backends)
+        self._rotation += 1
+        # 정렬은 안정적이므로 순위가 같으면 회전한 순서(round-robin)를 유지
+        rotated = self.backends[start:] + self.backends[:start]
+        return sorted(
+            rotated,
+            key=lambda b: (b.cooling_down(now), b.outstanding, b.percentile(0.5) or 0.0),
+        )
+
+    def _hedge_delay(self, backend: _Backend) -> Optional[float]:
+        if self.hedge_percentile is None or len(backend.latencies) < self.hedge_min_samples:
+            return None
+        return backend.percentile(self.hedge_percentile)
+
+    def _start(self, backend: _Backend, *args: Any) -> asyncio.Future:
+        # 동시에 들어온 요청이 같은 백엔드로 몰리지 않도록 작업 시작 전에 바로 집계
+        backend.outstanding += 1
+        task = asyncio.ensure_future(self._call(backend, *args))
+        # 시작 전에 취소된 작업도 집계에서 빠지도록 완료 콜백에서 감소
+        task.add_done_callback(lambda _: self._finish(backend))
+        return task
+
+    @staticmethod
+    def _finish(backend: _Backend) -> None:
+        backend.outstanding -= 1
+
+    async def _call(self, backend: _Backend, query: str, session_id: Optional[str], api_config: Optional[Dict[str, Any]], kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        started = time.monotonic()
+        try:
+            result = await backend.executor.ainvoke(query, session_id, api_config, **kwargs)
+        except asyncio.CancelledError:
+            # hedge에 져서 취소된 요청도 그때까지의 시간(실제 응답 시간의 하한)을 기록
+            # 느린 요청이 표본에서 빠져 hedge 기준이 점점 낮아지는 것을 막음
+            backend.latencies.append(time.monotonic() - started)
+            raise
+        except Exception:
+            backend.record_failure(self.failure_cooldown)
+            raise
+        backend.record_success(time.monotonic() - started)
+        return {**result, "backend": backend.name}
+
+    async def _race(self, candidates: List[_Backend], initial: int, *args: Any) -> Dict[str, Any]:
+        """`initial`개 백엔드에 먼저 보내고, 가장 먼저 성공한 응답 반환."""
+        remaining = list(candidates)
+        pending = set()
+        errors: List[BaseException] = []
+        hedges = 0
+        primary = remaining[0]
+
+        def launch() -> None:
+            pending.add(self._start(remaining.pop(0), *args))
+
+        for _ in range(min(initial, len(remaining))):
+            launch()
+        try:
+            while pending:
+                delay = None
+                if remaining and hedges < self.max_hedges:
+                    delay = self._hedge_delay(primary)
+                done, _ = await asyncio.wait(pending, timeout=delay, return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    # 평소보다 느림: 다음 백엔드로 중복 요청
+                    hedges += 1
+                    self._hedges += 1
+                    launch()
+                    continue
+                for task in done:
+                    pending.discard(task)
+                    if task.exception() is None:
+                        return task.result()
+                    errors.append(task.exception())
+                if not pending and remaining:
+                    launch()
+            raise errors[-1]
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _gather(self, *args: Any) -> Dict[str, Any]:
+        results = await asyncio.gather(
+            *(self._start(backend, *args) for backend in self.backends), return_exceptions=True
+        )
+        succeeded = [result for result in results if not isinstance(result, BaseException)]
+        if not succeeded:
+            raise results[-1]
+        return {
+            "content": self.separator.join(result.get("content", "") for result in succeeded),
+            "data": succeeded,
+            "is_task_complete": True,
+        }
+
+    async def aclose(self) -> None:
+        for backend in self.backends:
+            await backend.executor.aclose()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "strategy": self.strategy,
+            "hedges": self._hedges,
+            "backends": {backend.name: backend.stats() for backend in self.backends},
+        }
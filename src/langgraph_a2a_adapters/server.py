@@ -0,0 +1,94 @@
+"""멀티 워커 서빙용 앱 팩토리.
+
+`serve(workers=N, app_factory="myagent:adapter")`는 워커 프로세스마다 아래 `create_app`을
+호출하고, `create_app`은 `A2A_APP_FACTORY` 대상(어댑터 또는 `A2AHost`)을 다시 import해
+앱을 만듭니다.
+uvicorn CLI로 직접 실행할 수도 있습니다.
+
+```bash
+A2A_APP_FACTORY=myagent:adapter uvicorn langgraph_a2a_adapters.server:create_app --factory --workers 4
+```
+"""
+
+from __future__ import annotations
+
+import os
+from typing import Any, Optional
+
+import uvicorn
+from uvicorn.importer import import_from_string
+
+APP_FACTORY_ENV = "A2A_APP_FACTORY"
+PORT_ENV = "A2A_PORT"
+
+
+def load_target(target: str) -> Any:
+    """"module:attr" 대상을 어댑터/호스트 또는 ASGI 앱으로 변환.
+
+    attr은 어댑터, `A2AHost`, `@a2a_agent` 함수, ASGI 앱, 또는 이들을 반환하는 팩토리
+    함수입니다.
+    """
+    obj = import_from_string(target)
+    if hasattr(obj, "adapter"):
+        return obj.adapter
+    if _is_servable(obj) or not callable(obj) or _is_asgi_app(obj):
+        return obj
+    obj = obj()
+    return obj.adapter if hasattr(obj, "adapter") else obj
+
+
+def create_app() -> Any:
+    """워커 프로세스용 ASGI 앱 팩토리 (uvicorn `factory=True`)."""
+    target = os.environ.get(APP_FACTORY_ENV)
+    if not target:
+        raise RuntimeError(f"{APP_FACTORY_ENV} is not set (expected 'module:attr')")
+
+    obj = load_target(target)
+    if not _is_servable(obj):
+        return obj
+    if os.environ.get(PORT_ENV):
+        obj.set_port(int(os.environ[PORT_ENV]))
+    obj.prepare_workers()
+    return obj.app
+
+
+def run(
+    servable: Any,
+    host: str,
+    port: int,
+    workers: int = 1,
+    app_factory: Optional[str] = None,
+    timeout_keep_alive: int = 5,
+    backlog: int = 2048,
+    **uvicorn_options: Any,
+) -> None:
+    """어댑터/호스트를 uvicorn으로 실행 (`workers` > 1이면 `app_factory` 필요)."""
+    options = {
+        "host": host,
+        "port": port,
+        "log_level": "info",
+        "timeout_keep_alive": timeout_keep_alive,
+        "backlog": backlog,
+        **uvicorn_options,
+    }
+
+    if workers > 1:
+        if not app_factory:
+            raise ValueError("workers > 1 requires app_factory='module:attr' importable by worker processes")
+        os.environ[APP_FACTORY_ENV] = app_factory
+        os.environ[PORT_ENV] = str(port)
+        uvicorn.run("langgraph_a2a_adapters.server:create_app", factory=True, workers=workers, **options)
+        return
+
+    servable.prepare_workers()
+    uvicorn.run(servable.app, **options)
+
+
+def _is_servable(obj: Any) -> bool:
+    # LangGraphA2AAdapter, A2AHost
+    return hasattr(obj, "prepare_workers") and hasattr(obj, "set_port")
+
+
+def _is_asgi_app(obj: Any) -> bool:
+    # FastAPI/Starlette 앱은 호출 가능하지만 팩토리가 아님
+    return hasattr(obj, "router") or hasattr(obj, "routes")
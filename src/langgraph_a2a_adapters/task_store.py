@@ -0,0 +1,262 @@
+"""A2A Task 저장소."""
+
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from a2a.server.context import ServerCallContext
+from a2a.server.tasks import TaskStore
+from a2a.types import Task, TaskState
+
+TERMINAL_STATES = {
+    TaskState.completed,
+    TaskState.canceled,
+    TaskState.failed,
+    TaskState.rejected,
+}
+
+
+class BoundedTaskStore(TaskStore):
+    """개수/용량/TTL이 제한된 인메모리 Task 저장소.
+
+    종료 상태(completed, failed 등)의 Task만 한도 계산의 제거 대상이며, 한도를 넘으면 가장
+    오래 사용되지 않은 Task부터 제거합니다(LRU). 크기는 종료 상태로 저장될 때 JSON 길이로
+    계산합니다. 진행 중(submitted, working 등)인 Task는 `active_ttl`초 동안 갱신되지 않으면
+    버려진 것으로 보고 제거합니다.
+    """
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = 10_000,
+        max_bytes: Optional[int] = 256 * 1024 * 1024,
+        ttl: Optional[float] = 3600.0,
+        active_ttl: Optional[float] = 24 * 3600.0,
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.active_ttl = active_ttl
+        # task_id -> (task, 크기, 종료 시각)
+        self._tasks: OrderedDict[str, Tuple[Task, int, Optional[float]]] = OrderedDict()
+        # 종료 순서대로 정렬된 task_id -> 종료 시각 (TTL 만료 확인용)
+        self._finished: OrderedDict[str, float] = OrderedDict()
+        # 갱신 순서대로 정렬된 진행 중 task_id -> 마지막 저장 시각 (active_ttl 확인용)
+        self._active: OrderedDict[str, float] = OrderedDict()
+        self._bytes = 0
+        self._evictions = {"lru": 0, "size": 0, "ttl": 0, "stale": 0}
+
+    async def save(self, task: Task, context: ServerCallContext | None = None) -> None:
+        now = time.monotonic()
+        previous = self._tasks.pop(task.id, None)
+        if previous is not None:
+            self._bytes -= previous[1]
+
+        if task.status.state in TERMINAL_STATES:
+            size = len(task.model_dump_json(exclude_none=True))
+            finished_at = self._finished.setdefault(task.id, now)
+            self._active.pop(task.id, None)
+        else:
+            size, finished_at = 0, None
+            self._active.pop(task.id, None)
+            self._active[task.id] = now
+
+        self._tasks[task.id] = (task, size, finished_at)
+        self._bytes += size
+        self._evict(now)
+
+    async def get(self, task_id: str, context: ServerCallContext | None = None) -> Task | None:
+        entry = self._tasks.get(task_id)
+        if entry is None:
+            return None
+        reason = self._expired(task_id, entry, time.monotonic())
+        if reason is not None:
+            self._remove(task_id, reason)
+            return None
+        self._tasks.move_to_end(task_id)
+        return entry[0]
+
+    async def delete(self, task_id: str, context: ServerCallContext | None = None) -> None:
+        entry = self._tasks.pop(task_id, None)
+        if entry is not None:
+            self._bytes -= entry[1]
+            self._finished.pop(task_id, None)
+            self._active.pop(task_id, None)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "entries": len(self._tasks),
+            "active": len(self._active),
+            "bytes": self._bytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "evictions": dict(self._evictions),
+        }
+
+    def _expired(self, task_id: str, entry: Tuple[Task, int, Optional[float]], now: float) -> Optional[str]:
+        finished_at = entry[2]
+        if finished_at is not None:
+            return "ttl" if self.ttl is not None and now - finished_at > self.ttl else None
+        updated_at = self._active.get(task_id)
+        if self.active_ttl is not None and updated_at is not None and now - updated_at > self.active_ttl:
+            return "stale"
+        return None
+
+    def _remove(self, task_id: str, reason: str) -> None:
+        entry = self._tasks.pop(task_id)
+        self._finished.pop(task_id, None)
+        self._active.pop(task_id, None)
+        self._bytes -= entry[1]
+        self._evictions[reason] += 1
+
+    def _over_limit(self, entries: int, size: int) -> Optional[str]:
+        if self.max_entries is not None and entries > self.max_entries:
+            return "lru"
+        if self.max_bytes is not None and size > self.max_bytes:
+            return "size"
+        return None
+
+    def _evict(self, now: float) -> None:
+        if self.ttl is not None:
+            while self._finished:
+                task_id, finished_at = next(iter(self._finished.items()))
+                if now - finished_at <= self.ttl:
+                    break
+                self._remove(task_id, "ttl")
+        if self.active_ttl is not None:
+            # 실행 중 프로세스가 죽었거나 input-required 상태로 방치된 Task
+            while self._active:
+                task_id, updated_at = next(iter(self._active.items()))
+                if now - updated_at <= self.active_ttl:
+                    break
+                self._remove(task_id, "stale")
+
+        # 오래 사용되지 않은 종료 Task부터 한도 이내가 될 때까지 제거 (진행 중인 Task는 유지)
+        entries, size = len(self._tasks), self._bytes
+        victims = []
+        for task_id, (_, task_size, finished_at) in self._tasks.items():
+            reason = self._over_limit(entries, size)
+            if reason is None:
+                break
+            if finished_at is None:
+                continue
+            victims.append((task_id, reason))
+            entries -= 1
+            size -= task_size
+
+        for task_id, reason in victims:
+            self._remove(task_id, reason)
+
+
+class SQLiteTaskStore(TaskStore):
+    """SQLite 파일 기반 Task 저장소.
+
+    재시작 후에도 `tasks/get`이 동작하고, 완료된 Task를 Python 힙 밖에 보관합니다.
+    쓰기는 `flush_interval`초 또는 `batch_size`개 단위로 모아 한 트랜잭션으로 기록하며,
+    모든 DB 작업은 전용 스레드 하나에서 실행됩니다.
+    """
+
+    def __init__(self, path: str, batch_size: int = 100, flush_interval: float = 0.05):
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._db_thread = ThreadPoolExecutor(max_workers=1, thread_name_prefix="a2a-sqlite")
+        self._conn: Optional[sqlite3.Connection] = None
+        # 아직 기록되지 않은 Task (마지막 상태만 유지)
+        self._pending: Dict[str, Task] = {}
+        self._flush_task: Optional[asyncio.Task] = None
+        self._db_thread.submit(self._connect).result()
+
+    def _connect(self) -> None:
+        conn = sqlite3.connect(self.path, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS tasks (
+                id TEXT PRIMARY KEY,
+                context_id TEXT NOT NULL,
+                state TEXT NOT NULL,
+                data TEXT NOT NULL,
+                updated_at REAL NOT NULL
+            )
+            """
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_tasks_context_id ON tasks (context_id)")
+        conn.commit()
+        self._conn = conn
+
+    async def _run(self, func: Callable[..., Any], *args: Any) -> Any:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._db_thread, func, *args)
+
+    async def save(self, task: Task, context: ServerCallContext | None = None) -> None:
+        self._pending[task.id] = task
+        if len(self._pending) >= self.batch_size:
+            await self.flush()
+        elif self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_later())
+
+    async def get(self, task_id: str, context: ServerCallContext | None = None) -> Task | None:
+        task = self._pending.get(task_id)
+        if task is not None:
+            return task
+        row = await self._run(self._select_one, task_id)
+        return Task.model_validate_json(row[0]) if row else None
+
+    async def get_by_context(self, context_id: str) -> List[Task]:
+        """같은 contextId의 Task 목록 (갱신 순)."""
+        await self.flush()
+        rows = await self._run(self._select_by_context, context_id)
+        return [Task.model_validate_json(row[0]) for row in rows]
+
+    async def delete(self, task_id: str, context: ServerCallContext | None = None) -> None:
+        self._pending.pop(task_id, None)
+        await self._run(self._delete, task_id)
+
+    async def flush(self) -> None:
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, {}
+        now = time.time()
+        # 직렬화는 기록 시점에 한 번만 (스트리밍 중 반복 저장 비용 절감)
+        rows = [
+            (task.id, task.context_id, task.status.state.value, task.model_dump_json(exclude_none=True), now)
+            for task in pending.values()
+        ]
+        await self._run(self._write, rows)
+
+    async def close(self) -> None:
+        await self.flush()
+        await self._run(self._conn.close)
+        self._db_thread.shutdown(wait=True)
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self.flush_interval)
+        await self.flush()
+
+    def _write(self, rows: List[Tuple[Any, ...]]) -> None:
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO tasks (id, context_id, state, data, updated_at) VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+
+    def _select_one(self, task_id: str) -> Optional[Tuple[str]]:
+        return self._conn.execute("SELECT data FROM tasks WHERE id = ?", (task_id,)).fetchone()
+
+    def _select_by_context(self, context_id: str) -> List[Tuple[str]]:
+        return self._conn.execute(
+            "SELECT data FROM tasks WHERE context_id = ? ORDER BY updated_at", (context_id,)
+        ).fetchall()
+
+    def _delete(self, task_id: str) -> None:
+        with self._conn:
+            self._conn.execute("DELETE FROM tasks WHERE id = ?", (task_id,))
+
+    def stats(self) -> Dict[str, Any]:
+        return {"backend": "sqlite", "pending": len(self._pending)}
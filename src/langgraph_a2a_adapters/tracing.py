@@ -0,0 +1,276 @@
+"""OpenTelemetry 트레이싱 (선택 사항)."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+# configure_tracing() 전에는 None이며, 이때 모든 헬퍼는 opentelemetry를 import하지 않고 바로 반환
+_tracer: Any = None
+# configure_tracing이 직접 만든 TracerProvider (flush 대상)
+_provider: Any = None
+
+
+def configure_tracing(
+    endpoint: Optional[str] = None,
+    service_name: str = "langgraph-a2a-adapters",
+    sample_ratio: float = 1.0,
+    slow_threshold: Optional[float] = None,
+    exporter: Any = None,
+    tracer_provider: Any = None,
+    max_queue_size: int = 2048,
+    schedule_delay_ms: int = 5000,
+) -> Any:
+    """프로세스 전체의 트레이싱을 켜고 tracer 반환.
+
+    - head 샘플링: 새 trace는 `sample_ratio` 비율만 기록하고, 상위 에이전트가 보낸
+      `traceparent`가 있으면 그 샘플링 결정을 따름
+    - tail 샘플링: `slow_threshold`(초)를 주면 요청이 그보다 오래 걸렸거나 오류가 난
+      trace만 내보냄
+    - span은 `BatchSpanProcessor`로 모아서 OTLP/HTTP(`endpoint`, 없으면
+      `OTEL_EXPORTER_OTLP_*` 환경변수)로 전송
+
+    `tracer_provider`를 주면 그 provider를 그대로 사용합니다 (샘플링/내보내기 설정은 무시).
+    """
+    global _tracer, _provider
+    try:
+        from opentelemetry.sdk.resources import Resource
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import BatchSpanProcessor
+        from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
+    except ImportError as e:
+        raise ImportError(
+            "tracing requires opentelemetry-sdk "
+            "(pip install 'langgraph-a2a-adapters[tracing]')"
+        ) from e
+
+    if tracer_provider is None:
+        if exporter is None:
+            from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+            exporter = OTLPSpanExporter(endpoint=endpoint)
+        processor = BatchSpanProcessor(
+            exporter, max_queue_size=max_queue_size, schedule_delay_millis=schedule_delay_ms
+        )
+        if slow_threshold is not None:
+            processor = TailSamplingProcessor(processor, slow_threshold)
+        tracer_provider = TracerProvider(
+            resource=Resource.create({"service.name": service_name}),
+            sampler=ParentBased(TraceIdRatioBased(sample_ratio)),
+        )
+        tracer_provider.add_span_processor(processor)
+        _provider = tracer_provider
+
+    _tracer = tracer_provider.get_tracer("langgraph_a2a_adapters")
+    return _tracer
+
+
+def enabled() -> bool:
+    return _tracer is not None
+
+
+async def aflush() -> None:
+    """configure_tracing이 만든 provider의 대기 중인 span 전송 (이벤트 루프를 막지 않음)."""
+    if _provider is not None:
+        await asyncio.to_thread(_provider.force_flush)
+
+
+def span(
+    name: str,
+    kind: str = "internal",
+    carrier: Optional[Dict[str, str]] = None,
+    attributes: Optional[Dict[str, Any]] = None,
+):
+    """현재 span으로 설정되는 span (`carrier`가 있으면 그 헤더의 trace context를 부모로 사용).
+
+    트레이싱이 꺼져 있으면 `None`을 돌려주는 빈 컨텍스트 매니저.
+    """
+    if _tracer is None:
+        return _NULL_SPAN
+    return _current_span(name, kind, carrier, attributes)
+
+
+def client_span(name: str, headers: Dict[str, str], attributes: Optional[Dict[str, Any]] = None):
+    """나가는 요청용 span. 현재 컨텍스트는 바꾸지 않고 `headers`에 traceparent를 넣음.
+
+    async 제너레이터 안에서도 안전하게 쓸 수 있습니다.
+    """
+    if _tracer is None:
+        return _NULL_SPAN
+    return _client_span(name, headers, attributes)
+
+
+def set_outcome(current: Any, outcome: str) -> None:
+    """요청 결과(completed, rejected, failed, canceled)를 span에 기록."""
+    if current is None:
+        return
+    from opentelemetry.trace import StatusCode
+
+    current.set_attribute("a2a.outcome", outcome)
+    if outcome == "failed":
+        current.set_status(StatusCode.ERROR)
+
+
+def node_callback() -> Any:
+    """LangGraph 노드별 span을 만드는 콜백 핸들러 (꺼져 있으면 None)."""
+    if _tracer is None:
+        return None
+    from opentelemetry import context
+
+    return _node_handler_class()(_tracer, context.get_current())
+
+
+@contextmanager
+def _current_span(name: str, kind: str, carrier: Optional[Dict[str, str]], attributes: Optional[Dict[str, Any]]) -> Iterator[Any]:
+    from opentelemetry import propagate
+
+    parent = propagate.extract(carrier) if carrier is not None else None
+    with _tracer.start_as_current_span(name, context=parent, kind=_span_kind(kind), attributes=attributes) as current:
+        yield current
+
+
+@contextmanager
+def _client_span(name: str, headers: Dict[str, str], attributes: Optional[Dict[str, Any]]) -> Iterator[Any]:
+    from opentelemetry import propagate, trace
+    from opentelemetry.trace import StatusCode
+
+    current = _tracer.start_span(name, kind=trace.SpanKind.CLIENT, attributes=attributes)
+    propagate.inject(headers, context=trace.set_span_in_context(current))
+    try:
+        yield current
+    except GeneratorExit:
+        raise
+    except BaseException as e:
+        current.record_exception(e)
+        current.set_status(StatusCode.ERROR, str(e))
+        raise
+    finally:
+        current.end()
+
+
+def _span_kind(kind: str) -> Any:
+    from opentelemetry.trace import SpanKind
+
+    return getattr(SpanKind, kind.upper())
+
+
+_NODE_HANDLER = None
+
+
+def _node_handler_class() -> type:
+    # langchain_core 콜백 클래스는 트레이싱을 켰을 때만 정의
+    global _NODE_HANDLER
+    if _NODE_HANDLER is not None:
+        return _NODE_HANDLER
+
+    from langchain_core.callbacks import BaseCallbackHandler
+    from langgraph.errors import GraphBubbleUp
+    from opentelemetry.trace import StatusCode
+
+    class NodeSpanHandler(BaseCallbackHandler):
+        """노드 실행(`langgraph_node` 메타데이터의 노드 이름과 같은 run)마다 span 생성."""
+
+        # 이벤트 루프에서 바로 호출 (스레드로 넘기지 않음)
+        run_inline = True
+
+        def __init__(self, tracer: Any, parent: Any):
+            self._tracer = tracer
+            self._parent = parent
+            self._spans: Dict[Any, Any] = {}
+
+        def on_chain_start(self, serialized: Any, inputs: Any, *, run_id: Any, metadata: Optional[Dict[str, Any]] = None, **kwargs: Any) -> None:
+            node = (metadata or {}).get("langgraph_node")
+            if node is None or kwargs.get("name") != node:
+                return
+            self._spans[run_id] = self._tracer.start_span(
+                node,
+                context=self._parent,
+                attributes={"langgraph.node": node, "langgraph.step": metadata.get("langgraph_step", -1)},
+            )
+
+        def on_chain_end(self, outputs: Any, *, run_id: Any, **kwargs: Any) -> None:
+            current = self._spans.pop(run_id, None)
+            if current is not None:
+                current.end()
+
+        def on_chain_error(self, error: BaseException, *, run_id: Any, **kwargs: Any) -> None:
+            current = self._spans.pop(run_id, None)
+            if current is None:
+                return
+            # interrupt 등 LangGraph 제어 흐름 예외는 오류로 표시하지 않음
+            if not isinstance(error, GraphBubbleUp):
+                current.record_exception(error)
+                current.set_status(StatusCode.ERROR, str(error))
+            current.end()
+
+    _NODE_HANDLER = NodeSpanHandler
+    return _NODE_HANDLER
+
+
+class TailSamplingProcessor:
+    """trace의 로컬 루트 span이 끝날 때까지 span을 모았다가 느리거나 실패한 trace만 전달.
+
+    `max_traces`개를 넘게 대기하면 가장 오래된 trace를 버립니다.
+    """
+
+    def __init__(self, delegate: Any, slow_threshold: float, max_traces: int = 10_000):
+        self.delegate = delegate
+        self.slow_threshold = slow_threshold
+        self.max_traces = max_traces
+        self._traces: "OrderedDict[int, List[Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.exported = 0
+        self.dropped = 0
+
+    def on_start(self, span: Any, parent_context: Any = None) -> None:
+        pass
+
+    def _on_ending(self, span: Any) -> None:
+        pass
+
+    def on_end(self, span: Any) -> None:
+        trace_id = span.context.trace_id
+        # 원격 부모(다른 에이전트)를 가진 span도 이 프로세스에서는 루트
+        local_root = span.parent is None or span.parent.is_remote
+        with self._lock:
+            spans = self._traces.setdefault(trace_id, [])
+            spans.append(span)
+            if not local_root:
+                if len(self._traces) > self.max_traces:
+                    self._traces.popitem(last=False)
+                    self.dropped += 1
+                return
+            del self._traces[trace_id]
+
+        if self._keep(span, spans):
+            self.exported += 1
+            for finished in spans:
+                self.delegate.on_end(finished)
+        else:
+            self.dropped += 1
+
+    def _keep(self, root: Any, spans: List[Any]) -> bool:
+        from opentelemetry.trace import StatusCode
+
+        if (root.end_time - root.start_time) / 1e9 >= self.slow_threshold:
+            return True
+        return any(finished.status.status_code == StatusCode.ERROR for finished in spans)
+
+    def shutdown(self) -> None:
+        self.delegate.shutdown()
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        return self.delegate.force_flush(timeout_millis)
+
+
+class _NullSpan:
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *exc: Any) -> None:
+        return None
+
+
+_NULL_SPAN = _NullSpan()
@@ -0,0 +1,97 @@
+"""SQLite 파일 체크포인터."""
+
+import asyncio
+import operator
+import subprocess
+import sys
+from pathlib import Path
+from typing import Annotated, TypedDict
+
+import pytest
+from langgraph.graph import END, START, StateGraph
+
+from langgraph_a2a_adapters import AgentConfig, LangGraphA2AAdapter
+
+pytest.importorskip("langgraph.checkpoint.sqlite.aio")
+
+
+class State(TypedDict):
+    query: str
+    turns: Annotated[list, operator.add]
+    reply: str
+
+
+def count(state: State) -> dict:
+    return {"turns": [state["query"]], "reply": f"turn {len(state.get('turns', [])) + 1}"}
+
+
+def build_graph():
+    builder = StateGraph(State)
+    builder.add_node("count", count)
+    builder.add_edge(START, "count")
+    builder.add_edge("count", END)
+    return builder.compile()
+
+
+def test_file_path_outside_event_loop(tmp_path):
+    # 이벤트 루프 밖(모듈 최상위)에서 만들어도 RuntimeError가 나지 않아야 함
+    path = str(tmp_path / "state.db")
+    adapter = LangGraphA2AAdapter.from_graph(
+        build_graph(),
+        AgentConfig(name="checkpointed"),
+        checkpointer=path,
+        input_key="query",
+        output_key="reply",
+        use_langchain_messages=False,
+    )
+    executor = adapter.executor
+    assert executor.has_checkpointer
+
+    async def turns():
+        first = await executor.ainvoke("hi", session_id="thread-1")
+        second = await executor.ainvoke("again", session_id="thread-1")
+        other = await executor.ainvoke("hi", session_id="thread-2")
+        saver = executor.graph.checkpointer
+        await adapter.aclose()
+        return first, second, other, saver
+
+    first, second, other, saver = asyncio.run(turns())
+    assert first["content"] == "turn 1"
+    assert second["content"] == "turn 2"
+    assert other["content"] == "turn 1"
+    # aclose가 aiosqlite 커넥션을 닫음
+    with pytest.raises(ValueError):
+        asyncio.run(saver.conn.execute("SELECT 1"))
+
+    # 새 이벤트 루프에서도 같은 파일의 대화 상태를 이어감
+    async def resume():
+        try:
+            return await executor.ainvoke("more", session_id="thread-1")
+        finally:
+            await adapter.aclose()
+
+    assert asyncio.run(resume())["content"] == "turn 3"
+
+
+def test_sync_invoke_closes_connection(tmp_path):
+    # 동기 invoke가 임시 루프에서 연 aiosqlite 스레드를 닫지 않으면 인터프리터가 종료되지 않음
+    script = f"""
+import sys
+sys.path.insert(0, {str(Path(__file__).parent)!r})
+from test_checkpointer import build_graph
+from langgraph_a2a_adapters import AgentConfig, LangGraphA2AAdapter
+
+adapter = LangGraphA2AAdapter.from_graph(
+    build_graph(),
+    AgentConfig(name="checkpointed"),
+    checkpointer={str(tmp_path / "state.db")!r},
+    input_key="query",
+    output_key="reply",
+    use_langchain_messages=False,
+)
+print(adapter.executor.invoke("a", session_id="t")["content"])
+print(adapter.executor.invoke("b", session_id="t")["content"])
+"""
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, timeout=30)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.split() == ["turn", "1", "turn", "2"]
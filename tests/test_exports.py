@@ -0,0 +1,8 @@
+"""패키지 공개 이름."""
+
+import langgraph_a2a_adapters
+
+
+def test_all_matches_lazy_exports():
+    # __all__은 린터가 읽을 수 있도록 리터럴 목록으로 유지
+    assert sorted(langgraph_a2a_adapters.__all__) == sorted(langgraph_a2a_adapters._EXPORTS)
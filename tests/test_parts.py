@@ -0,0 +1,87 @@
+"""메시지 파트 추출."""
+
+import asyncio
+import base64
+import binascii
+import os
+
+import httpx
+import pytest
+from a2a.types import DataPart, FilePart, FileWithBytes, Message, Part, Role, TextPart
+
+from langgraph_a2a_adapters import AgentConfig, LangGraphA2AAdapter
+from langgraph_a2a_adapters.parts import extract_input
+
+
+def message(*parts) -> Message:
+    return Message(role=Role.user, message_id="m", parts=[Part(root=part) for part in parts])
+
+
+def test_text_parts_joined_with_newline():
+    # 기존에는 첫 텍스트 파트만 입력으로 사용했음
+    request_input = extract_input(
+        message(TextPart(text="first"), DataPart(data={"k": 1}), TextPart(text="second")),
+        spool_threshold=1024,
+    )
+    assert request_input.text == "first\nsecond"
+    assert request_input.data == [{"k": 1}]
+
+
+def test_single_text_part_unchanged():
+    assert extract_input(message(TextPart(text="only")), spool_threshold=1024).text == "only"
+
+
+def test_spooled_file_with_line_breaks():
+    payload = os.urandom(5000)
+    # MIME 스타일(76자마다 줄바꿈) base64
+    part = FilePart(file=FileWithBytes(bytes=base64.encodebytes(payload).decode(), name="big.bin"))
+    request_input = extract_input(message(part), spool_threshold=1000)
+    try:
+        (spooled,) = request_input.files
+        assert spooled.path is not None
+        assert spooled.read_bytes() == payload
+        # Task 기록에는 base64 원본 대신 크기만 남음
+        assert part.file.bytes == ""
+        assert part.metadata == {"bytes_omitted": True, "size": len(payload)}
+    finally:
+        request_input.cleanup()
+
+
+def test_tabs_are_whitespace():
+    payload = os.urandom(600)
+    encoded = "\t".join(base64.b64encode(payload).decode()[i:i + 64] for i in range(0, 800, 64))
+    for threshold in (10_000, 100):
+        request_input = extract_input(message(FilePart(file=FileWithBytes(bytes=encoded))), spool_threshold=threshold)
+        try:
+            assert request_input.files[0].read_bytes() == payload
+        finally:
+            request_input.cleanup()
+
+
+@pytest.mark.parametrize("threshold", [100_000, 1000])
+def test_malformed_base64_rejected(threshold):
+    # 기존에는 base64가 아닌 문자를 버려 0바이트 파일로 처리했음
+    part = FilePart(file=FileWithBytes(bytes="!!!" * 2000))
+    with pytest.raises(binascii.Error):
+        extract_input(message(part), spool_threshold=threshold)
+
+
+def test_malformed_file_part_fails_task():
+    adapter = LangGraphA2AAdapter.from_function(lambda query: "ok", AgentConfig(name="files"))
+    file_part = {"kind": "file", "file": {"bytes": "!!!" * 2000, "name": "bad.bin"}}
+    body = {
+        "jsonrpc": "2.0",
+        "id": "1",
+        "method": "message/send",
+        "params": {"message": {"role": "user", "messageId": "m", "parts": [file_part]}},
+    }
+
+    async def send():
+        transport = httpx.ASGITransport(app=adapter.app)
+        try:
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                return (await client.post("/", json=body)).json()
+        finally:
+            await adapter.aclose()
+
+    assert asyncio.run(send())["result"]["status"]["state"] == "failed"
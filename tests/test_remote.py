@@ -0,0 +1,57 @@
+"""원격 A2A 에이전트 호출."""
+
+import asyncio
+import operator
+from typing import Annotated, TypedDict
+
+import httpx
+from langgraph.graph import END, START, StateGraph
+
+from langgraph_a2a_adapters import AgentConfig, LangGraphA2AAdapter
+from langgraph_a2a_adapters.remote import RemoteA2AExecutor
+
+
+class State(TypedDict):
+    query: str
+    turns: Annotated[list, operator.add]
+    reply: str
+
+
+def count(state: State) -> dict:
+    return {"turns": [state["query"]], "reply": f"turn {len(state.get('turns', [])) + 1}"}
+
+
+def build_graph():
+    builder = StateGraph(State)
+    builder.add_node("count", count)
+    builder.add_edge(START, "count")
+    builder.add_edge("count", END)
+    return builder.compile()
+
+
+def test_session_id_sent_as_context_id():
+    remote_adapter = LangGraphA2AAdapter.from_graph(
+        build_graph(),
+        AgentConfig(name="checkpointed"),
+        checkpointer="memory",
+        input_key="query",
+        output_key="reply",
+        use_langchain_messages=False,
+    )
+
+    async def turns():
+        client = httpx.AsyncClient(transport=httpx.ASGITransport(app=remote_adapter.app), base_url="http://remote")
+        executor = RemoteA2AExecutor("http://remote", client=client)
+        try:
+            return [
+                (await executor.ainvoke("hi", session_id="thread-1"))["content"],
+                (await executor.ainvoke("again", session_id="thread-1"))["content"],
+                (await executor.ainvoke("hi", session_id="thread-2"))["content"],
+                (await executor.ainvoke("hi"))["content"],
+            ]
+        finally:
+            await client.aclose()
+            await remote_adapter.aclose()
+
+    # 원격 에이전트가 contextId별로 대화 상태를 이어감
+    assert asyncio.run(turns()) == ["turn 1", "turn 2", "turn 1", "turn 1"]
@@ -0,0 +1,94 @@
+"""응답 캐시 키."""
+
+import asyncio
+import operator
+from typing import Annotated, TypedDict
+
+import httpx
+from langgraph.graph import END, START, StateGraph
+
+from langgraph_a2a_adapters import AgentConfig, LangGraphA2AAdapter
+
+
+class State(TypedDict):
+    query: str
+    turns: Annotated[list, operator.add]
+    reply: str
+
+
+def count(state: State) -> dict:
+    return {"turns": [state["query"]], "reply": f"turn {len(state.get('turns', [])) + 1}"}
+
+
+def build_graph():
+    builder = StateGraph(State)
+    builder.add_node("count", count)
+    builder.add_edge(START, "count")
+    builder.add_edge("count", END)
+    return builder.compile()
+
+
+def send(client: httpx.AsyncClient, text: str, context_id=None, headers=None):
+    message = {"role": "user", "messageId": f"m-{text}", "parts": [{"kind": "text", "text": text}]}
+    if context_id is not None:
+        message["contextId"] = context_id
+    body = {"jsonrpc": "2.0", "id": "1", "method": "message/send", "params": {"message": message}}
+    return client.post("/", json=body, headers=headers or {})
+
+
+def reply(response: httpx.Response) -> str:
+    return response.json()["result"]["history"][-1]["parts"][0]["text"]
+
+
+def run_with(adapter: LangGraphA2AAdapter, scenario):
+    async def main():
+        transport = httpx.ASGITransport(app=adapter.app)
+        try:
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                return await scenario(client)
+        finally:
+            await adapter.aclose()
+
+    return asyncio.run(main())
+
+
+def test_checkpointed_graph_skips_cache():
+    adapter = LangGraphA2AAdapter.from_graph(
+        build_graph(),
+        AgentConfig(name="checkpointed", response_cache=True),
+        checkpointer="memory",
+        input_key="query",
+        output_key="reply",
+        use_langchain_messages=False,
+    )
+
+    async def scenario(client):
+        return [
+            reply(await send(client, "hi", "ctx1")),
+            reply(await send(client, "hi", "ctx1")),
+            reply(await send(client, "hi", "ctx2")),
+        ]
+
+    # 같은 입력이라도 대화마다 그래프를 실행하고 체크포인트에 기록
+    assert run_with(adapter, scenario) == ["turn 1", "turn 2", "turn 1"]
+
+
+def test_tenants_do_not_share_entries():
+    calls = []
+
+    def answer(query: str) -> str:
+        calls.append(query)
+        return f"answer {len(calls)}"
+
+    adapter = LangGraphA2AAdapter.from_function(answer, AgentConfig(name="cached", response_cache=True))
+
+    async def scenario(client):
+        return [
+            reply(await send(client, "hi", headers={"X-Tenant": "a"})),
+            reply(await send(client, "hi", headers={"X-Tenant": "b"})),
+            reply(await send(client, "hi", headers={"X-Tenant": "a"})),
+        ]
+
+    # 기본 키에 모든 X- 헤더가 포함됨
+    assert run_with(adapter, scenario) == ["answer 1", "answer 2", "answer 1"]
+    assert len(calls) == 2
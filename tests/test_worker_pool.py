@@ -0,0 +1,20 @@
+"""워커 풀 설정."""
+
+import pytest
+
+from langgraph_a2a_adapters import AgentConfig, LangGraphA2AAdapter
+
+
+async def async_answer(query: str) -> str:
+    return query
+
+
+async def async_chunks(query: str):
+    yield query
+
+
+@pytest.mark.parametrize("target", [async_answer, async_chunks])
+def test_process_mode_rejects_async_targets(target):
+    # async 대상은 이벤트 루프에서 실행되어 프로세스 격리가 적용되지 않음
+    with pytest.raises(ValueError, match="worker_mode='process'"):
+        LangGraphA2AAdapter.from_function(target, AgentConfig(name="cpu", worker_mode="process"))